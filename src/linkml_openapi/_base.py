@@ -36,8 +36,10 @@ from linkml_runtime.utils.schemaview import SchemaView
 class Generator:
     """SchemaView-only Generator base for linkml-openapi."""
 
-    schema: str | None = None
-    """Path to a LinkML schema file, or YAML/JSON schema source."""
+    schema: str | SchemaView | None = None
+    """Path to a LinkML schema file, YAML/JSON schema source, or an
+    already-loaded ``SchemaView`` (reused as-is, so the schema is not
+    parsed again)."""
 
     format: str | None = None
     """Output format. Defaults to ``valid_formats[0]`` when unset."""
@@ -64,5 +66,9 @@ class Generator:
             raise ValueError(f"Unrecognized format: {self.format!r}; known={self.valid_formats}")
         # SchemaView already accepts the full union (path, YAML/JSON source,
         # SchemaDefinition, file-like) that the upstream Generator did, so
-        # no wrapping is needed here.
-        self.schemaview: SchemaView = SchemaView(self.schema)
+        # no wrapping is needed here. A caller that has already loaded the
+        # schema (the Spring emitter's sidecar spec) passes its view in.
+        if isinstance(self.schema, SchemaView):
+            self.schemaview: SchemaView = self.schema
+        else:
+            self.schemaview = SchemaView(self.schema)
@@ -55,19 +55,21 @@ def build_parent_chains_index(
     doesn't blow up.
     """
     direct_parents: dict[str, list[tuple[str, str]]] = {}
-    for parent_name in sv.all_classes():
+    # Materialised once: range checks below are set-style membership
+    # tests rather than a `sv.get_class` resolution per slot.
+    all_classes = sv.all_classes()
+    for parent_name, parent_cls in all_classes.items():
         if parent_name in excluded_classes:
             continue
         if parent_name not in resource_classes:
             continue
-        parent_cls = sv.get_class(parent_name)
         for slot in induced_slots(parent_name):
             if not slot.multivalued:
                 continue
             if is_slot_excluded(slot):
                 continue
             target = slot.range
-            if not target or sv.get_class(target) is None:
+            if not target or target not in all_classes:
                 continue
             if target == parent_name:
                 continue  # self-loop
@@ -86,6 +86,7 @@ def walk_query_params(
     induced_slots: Callable[[str], list[SlotDefinition]],
     get_slot_annotation: Callable[[ClassDefinition, str, str], str | None],
     get_class_annotation: Callable[[ClassDefinition, str], str | None],
+    is_enum: Callable[[str], bool] | None = None,
 ) -> QueryParamSurface:
     """Compute the query-param surface for `cls`.
 
@@ -99,7 +100,13 @@ def walk_query_params(
     * `comparable` and `sortable` imply `equality`.
     * Unknown tokens warn; `sortable` on multivalued raises;
       `comparable` on a non-ordered range warns.
+
+    `is_enum` classifies a range name during auto-inference; callers
+    that already hold the schema's enum names pass a set lookup here.
+    Defaults to ``sv.get_enum``.
     """
+    is_enum = is_enum or (lambda range_name: sv.get_enum(range_name) is not None)
+
     auto_class = get_class_annotation(cls, "openapi.auto_query_params")
     if auto_class is not None:
         auto_enabled = str(auto_class).lower() == "true"
@@ -149,9 +156,7 @@ def walk_query_params(
         if slot.multivalued or slot.identifier:
             continue
         range_name = slot.range or "string"
-        is_scalar = range_name in ("string", "integer", "boolean") or (
-            sv.get_enum(range_name) is not None
-        )
+        is_scalar = range_name in ("string", "integer", "boolean") or is_enum(range_name)
         if is_scalar:
             inferred.append(QueryParamSpec(slot=slot, capabilities=frozenset({"equality"})))
 
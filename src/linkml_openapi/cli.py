@@ -1,11 +1,16 @@
 """CLI for generating OpenAPI specs from LinkML schemas."""
 
+import sys
 from pathlib import Path
 
 import click
 
 from linkml_openapi import __version__
-from linkml_openapi.generator import SUPPORTED_PATH_STYLES, OpenAPIGenerator
+
+# The generator (and with it pydantic, openapi-pydantic and
+# linkml-runtime) is imported inside the command body, so `--help` and
+# `--version` don't pay for it. The choice lists below mirror
+# `OpenAPIGenerator.valid_formats` and `SUPPORTED_PATH_STYLES`.
 
 
 @click.command(name="gen-openapi")
@@ -13,8 +18,8 @@ from linkml_openapi.generator import SUPPORTED_PATH_STYLES, OpenAPIGenerator
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(OpenAPIGenerator.valid_formats),
-    default=OpenAPIGenerator.valid_formats[0],
+    type=click.Choice(["yaml", "json"]),
+    default="yaml",
     show_default=True,
     help="Output format.",
 )
@@ -70,7 +75,7 @@ from linkml_openapi.generator import SUPPORTED_PATH_STYLES, OpenAPIGenerator
 )
 @click.option(
     "--path-style",
-    type=click.Choice(sorted(SUPPORTED_PATH_STYLES)),
+    type=click.Choice(["kebab-case", "snake_case"]),
     default=None,
     help=(
         "URL path-segment convention. Defaults to the schema-level "
@@ -171,12 +176,17 @@ from linkml_openapi.generator import SUPPORTED_PATH_STYLES, OpenAPIGenerator
 @click.version_option(__version__, "-V", "--version")
 def cli(yamlfile, resource_filter=(), emit_name_mappings=None, post_process=None, **kwargs):
     """Generate an OpenAPI specification from a LinkML schema."""
+    from linkml_openapi.generator import OpenAPIGenerator
+
     resource_filter = list(resource_filter) if resource_filter else None
     if post_process:
         kwargs["post_processors"] = [n.strip() for n in post_process.split(",") if n.strip()]
     gen = OpenAPIGenerator(yamlfile, resource_filter=resource_filter, **kwargs)
-    spec = gen.serialize()
-    click.echo(spec)
+    # Stream the spec rather than building it as one string. The extra
+    # newline keeps stdout identical to `click.echo(gen.serialize())`.
+    gen.serialize_to(sys.stdout)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
     if emit_name_mappings is not None:
         content = gen.emit_name_mappings()
         if content:
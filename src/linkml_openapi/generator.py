@@ -7,11 +7,13 @@ Converts LinkML schema definitions into OpenAPI 3.1 specifications with:
 """
 
 import json
+import math
 import os
 import re
 import warnings
 from dataclasses import dataclass, field
-from typing import Any, ClassVar
+from functools import lru_cache
+from typing import Any, ClassVar, TextIO
 
 import yaml
 from linkml_runtime.linkml_model import ClassDefinition, SlotDefinition
@@ -48,6 +50,87 @@ from linkml_openapi._query_params import (
     walk_query_params,
 )
 
+# libyaml's C emitter is several times faster than PyYAML's pure-Python
+# one on large specs. The spec is plain dicts / lists / scalars by the
+# time it reaches the dumper, so the safe variant is sufficient.
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+# orjson is an optional speed-up for ``--format json``; the stdlib
+# encoder is used when it isn't installed.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7e]")
+
+
+def _escape_non_ascii(match: re.Match) -> str:
+    """``\\uXXXX`` escape for one character, as ``json.dumps`` emits it."""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return "\\u%04x\\u%04x" % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return "\\u%04x" % code
+
+
+def _has_stdlib_only_float(node: Any) -> bool:
+    """True when ``node`` holds a float orjson would write differently.
+
+    orjson writes NaN and ±Infinity as ``null`` (``json.dumps`` keeps
+    ``NaN`` / ``Infinity``) and formats exponents its own way (``1e-7``
+    vs ``1e-07``, ``1e16`` vs ``1e+16``). Specs rarely carry floats at
+    all, so the walk is cheap next to the encode it guards.
+    """
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, float) and (not math.isfinite(item) or "e" in repr(item)):
+            return True
+    return False
+
+
+def _dump_json(raw: dict[str, Any]) -> str:
+    """Serialise the spec as 2-space-indented JSON.
+
+    Uses orjson when available. Its output is made to match
+    ``json.dumps(raw, indent=2)`` by escaping non-ASCII characters (and
+    DEL) the way ``ensure_ascii`` does; payloads orjson rejects (non-string keys,
+    integers beyond 64 bits) fall back to the stdlib encoder. Datetimes,
+    dataclasses and ``str``/``int`` subclasses are passed through to that
+    fallback too, so a post-processor that leaves one in the spec gets the
+    stdlib's result (or its ``TypeError``) either way, as do specs holding
+    non-finite or exponent-form floats (see :func:`_has_stdlib_only_float`).
+    Remaining difference: ``uuid.UUID`` / plain ``enum.Enum`` values, which
+    orjson encodes and the stdlib rejects.
+    """
+    if orjson is not None and not _has_stdlib_only_float(raw):
+        try:
+            text = orjson.dumps(raw, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
+        else:
+            if _NON_ASCII_RE.search(text):
+                text = _NON_ASCII_RE.sub(_escape_non_ascii, text)
+            return text + "\n"
+    return json.dumps(raw, indent=2) + "\n"
+
+
 # LinkML range → OpenAPI DataType mapping
 RANGE_TYPE_MAP: dict[str, dict[str, Any]] = {
     "string": {"type": DataType.STRING},
@@ -63,12 +146,39 @@ RANGE_TYPE_MAP: dict[str, dict[str, Any]] = {
     "ncname": {"type": DataType.STRING},
     "nodeidentifier": {"type": DataType.STRING, "format": "uri"},
 }
+# RFC 7396 request bodies are JSON-only, whatever the class's media types.
+_MERGE_PATCH_MEDIA_TYPES = ("application/merge-patch+json",)
+
+# Unknown ranges (custom types) render as plain strings.
+_DEFAULT_RANGE_TYPE = RANGE_TYPE_MAP["string"]
+
+# `limit` / `offset` paging parameters shared by every list endpoint.
+# They are never mutated after construction and the spec is dumped to
+# fresh dicts, so one instance of each serves every build.
+_PAGING_PARAMS: tuple[Parameter, ...] = (
+    Parameter.model_construct(
+        name="limit",
+        param_in=ParameterLocation.QUERY,
+        param_schema=Schema.model_construct(type=DataType.INTEGER, default=100),
+    ),
+    Parameter.model_construct(
+        name="offset",
+        param_in=ParameterLocation.QUERY,
+        param_schema=Schema.model_construct(type=DataType.INTEGER, default=0),
+    ),
+)
 
 
 # Class-name suffixes that are already plural (or unchanged in plural form)
 # and should be returned as-is from `_pluralize`.
 _INVARIANT_PLURAL_SUFFIXES = ("series", "species", "genus")
 
+# Regular-pluralization rule table for `_pluralize`, keyed on the final
+# one or two characters of the name.
+_ES_PLURAL_FINAL_CHARS = frozenset("sxz")
+_ES_PLURAL_FINAL_PAIRS = frozenset(("ch", "sh"))
+_VOWELS_KEEPING_Y = frozenset("aeou")
+
 # Class-name suffixes that become irregular in plural form. We don't try
 # to inflect these — we just emit a heads-up so the user can set
 # `openapi.path` explicitly. Listed lower-case for case-insensitive match.
@@ -84,6 +194,7 @@ _IRREGULAR_HINT_SUFFIXES = (
 )
 
 
+@lru_cache(maxsize=None)
 def _pluralize(name: str) -> str:
     """Pluralize an English noun for URL paths.
 
@@ -97,17 +208,13 @@ def _pluralize(name: str) -> str:
     """
     if not name:
         return name
+    if name.lower().endswith(_INVARIANT_PLURAL_SUFFIXES):
+        return name
 
-    lower = name.lower()
-    for inv in _INVARIANT_PLURAL_SUFFIXES:
-        if lower.endswith(inv):
-            return name
-
-    if name.endswith(("ch", "sh")):
+    last = name[-1]
+    if last in _ES_PLURAL_FINAL_CHARS or name[-2:] in _ES_PLURAL_FINAL_PAIRS:
         return name + "es"
-    if name.endswith(("s", "x", "z")):
-        return name + "es"
-    if name.endswith("y") and name[-2:] not in ("ay", "ey", "oy", "uy"):
+    if last == "y" and name[-2:-1] not in _VOWELS_KEEPING_Y:
         return name[:-1] + "ies"
     return name + "s"
 
@@ -120,10 +227,23 @@ def _is_irregular_plural_hint(name: str) -> bool:
     return any(lower.endswith(suf) for suf in _IRREGULAR_HINT_SUFFIXES)
 
 
+@lru_cache(maxsize=None)
 def _to_snake_case(name: str) -> str:
-    """Convert CamelCase to snake_case."""
-    s = re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name)
-    return s.lower()
+    """Convert CamelCase to snake_case.
+
+    An underscore goes before each ASCII capital that follows an ASCII
+    lowercase letter or digit (``HTMLParser`` → ``htmlparser``,
+    ``Dataset2Series`` → ``dataset2_series``). A plain character scan
+    is cheaper than ``re.sub`` with a lookbehind on short identifiers.
+    """
+    out: list[str] = []
+    after_lower_or_digit = False
+    for ch in name:
+        if after_lower_or_digit and "A" <= ch <= "Z":
+            out.append("_")
+        out.append(ch)
+        after_lower_or_digit = "a" <= ch <= "z" or "0" <= ch <= "9"
+    return "".join(out).lower()
 
 
 def _is_truthy(value: object) -> bool:
@@ -133,6 +253,7 @@ def _is_truthy(value: object) -> bool:
     return str(value).lower() == "true"
 
 
+@lru_cache(maxsize=None)
 def _to_path_segment(name: str) -> str:
     """Convert class name to URL path segment: CamelCase → snake_case → plural."""
     return _pluralize(_to_snake_case(name))
@@ -153,6 +274,9 @@ def _parse_csv(value: str | None, *, lowercase: bool = False) -> list[str]:
 PATH_STYLE_SNAKE = "snake_case"
 PATH_STYLE_KEBAB = "kebab-case"
 SUPPORTED_PATH_STYLES: frozenset[str] = frozenset({PATH_STYLE_SNAKE, PATH_STYLE_KEBAB})
+# camelCase split points for `openapi.path_split_camel` under kebab-case.
+_ACRONYM_BOUNDARY_RE = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_LOWER_UPPER_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
 
 # Operation tokens accepted by `openapi.operations`. Order matters for
 # the default emission tuple — list/create on collection, then item ops.
@@ -253,6 +377,26 @@ class OpenAPIGenerator(Generator):
 
     def serialize(self, **kwargs) -> str:
         """Generate and serialize the OpenAPI spec."""
+        raw = self._build_spec_dict()
+        if self.format == "json":
+            return _dump_json(raw)
+        return yaml.dump(raw, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+
+    def serialize_to(self, stream: TextIO) -> None:
+        """Generate the OpenAPI spec and write it to a text stream.
+
+        Same output as :meth:`serialize`, but YAML is emitted straight
+        into ``stream`` rather than materialised as one string first —
+        the CLI uses this to write large specs to stdout.
+        """
+        raw = self._build_spec_dict()
+        if self.format == "json":
+            stream.write(_dump_json(raw))
+            return
+        yaml.dump(raw, stream, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+
+    def _build_spec_dict(self) -> dict[str, Any]:
+        """Build the spec and run the dict-level passes; shared by both serialisers."""
         # Reset the x-rdf-* maps; _build_openapi populates them as it walks the schema.
         self._x_rdf_class: dict[str, str] = {}
         self._x_rdf_property: dict[tuple[str, str], str] = {}
@@ -261,6 +405,30 @@ class OpenAPIGenerator(Generator):
         # every reference site. Reset here to pick up any schema-view
         # changes between successive ``serialize()`` calls.
         self._concrete_descendants_cache: dict[str, list[str]] = {}
+        # Per-build memo of ``sv.all_classes()`` / ``sv.get_class(name)``.
+        # Every emitter resolves class definitions by name (tags, path
+        # ids, range checks, discriminator walks), so the same handful
+        # of names get looked up hundreds of times per build. Set before
+        # anything else below touches the schema.
+        self._class_names_cache: list[str] | None = None
+        self._class_def_cache: dict[str, ClassDefinition | None] = {}
+        self._enum_names_cache: frozenset[str] | None = None
+        self._class_name_set_cache: frozenset[str] | None = None
+        # Per-build cache of induced slots keyed `(class_name, slot_name)`.
+        # `_get_slot_annotation`, `_render_slot_segment`, and the
+        # nested-path / chain emitters used to call
+        # `class_induced_slots(name)` and linearly scan the result on
+        # every lookup, giving O(slots²) per class. The cache collapses
+        # the inner loop to O(1). Reset up front so profile drift
+        # detection shares the walk with the rest of the build.
+        self._induced_slot_cache: dict[str, dict[str, SlotDefinition]] = {}
+        # Per-build annotation lookups: class tag maps keyed by class
+        # name, and resolved slot annotations keyed `(class, slot, tag)`.
+        self._class_annotations_cache: dict[str, dict[str, str]] = {}
+        self._slot_annotation_cache: dict[tuple[str, str, str], str | None] = {}
+        self._slot_usage_annotations_cache: dict[str, dict[str, dict[str, str]]] = {}
+        self._slot_schema_cache: dict[int, tuple[SlotDefinition, Schema | Reference]] = {}
+        self._identifier_slot_cache: dict[str, SlotDefinition | None] = {}
         # Codegen field-name overrides — accumulated for the companion
         # ``name-mappings`` file. openapi-generator does not have a
         # universal *spec-level* extension that reliably renames a
@@ -282,6 +450,23 @@ class OpenAPIGenerator(Generator):
         # None when error_schema is off. Cached per-build so each operation
         # builder doesn't re-resolve.
         self._error_class_name: str | None = self._resolve_error_class()
+        # Non-2xx responses keyed by description. Every CRUD builder
+        # attaches the same handful ("Not found", "Validation error"),
+        # so one shared model per description replaces a fresh
+        # Response + MediaType pair per operation.
+        self._error_response_cache: dict[str, Response] = {}
+        # One shared ``$ref`` per component schema name. References are
+        # never mutated once built, and every operation builder points at
+        # the same handful of components.
+        self._schema_ref_cache: dict[str, Reference] = {}
+        # Parsed openapi.media_types per class name.
+        self._media_types_cache: dict[str, list[str]] = {}
+        # `content` maps keyed by (id(schema), media types). Read, create,
+        # update and patch of a class all advertise the same shared `$ref`
+        # under the same media types, so they share one map.
+        self._content_cache: dict[
+            tuple[int, tuple[str, ...]], tuple[Schema | Reference, dict[str, MediaType]]
+        ] = {}
         # Resolve the active path-style: CLI / Python kwarg wins over the
         # schema-level annotation, which falls back to `"snake_case"`. We
         # validate once here so per-call-site renderers can just check the
@@ -299,13 +484,6 @@ class OpenAPIGenerator(Generator):
             self._excluded_slots,
             self._profile_description,
         ) = self._resolve_profile_filter()
-        # Per-build cache of induced slots keyed `(class_name, slot_name)`.
-        # `_get_slot_annotation`, `_render_slot_segment`, and the
-        # nested-path / chain emitters used to call
-        # `class_induced_slots(name)` and linearly scan the result on
-        # every lookup, giving O(slots²) per class. The cache collapses
-        # the inner loop to O(1).
-        self._induced_slot_cache: dict[str, dict[str, SlotDefinition]] = {}
         # Pre-compute the resource-class list once. `_collect_parent_chains`
         # and `_build_openapi` both need it, and the underlying walk is
         # O(classes × slots).
@@ -320,7 +498,7 @@ class OpenAPIGenerator(Generator):
         # O(1) instead of re-walking the relationship graph.
         self._parent_chains_index = self._collect_parent_chains()
         spec = self._build_openapi()
-        raw = json.loads(spec.model_dump_json(by_alias=True, exclude_none=True))
+        raw = spec.model_dump(by_alias=True, exclude_none=True, mode="json")
         raw["openapi"] = self.openapi_version
         self._strip_invalid_parameter_fields(raw)
         self._coerce_numeric_constraints(raw)
@@ -331,9 +509,7 @@ class OpenAPIGenerator(Generator):
             from linkml_openapi.post_processors import apply as _apply_post
 
             raw = _apply_post(raw, list(self.post_processors))
-        if self.format == "json":
-            return json.dumps(raw, indent=2) + "\n"
-        return yaml.dump(raw, default_flow_style=False, sort_keys=False)
+        return raw
 
     def name_mappings(self) -> dict[str, str]:
         """Return the wire→codegen rename map collected during the build.
@@ -414,7 +590,14 @@ class OpenAPIGenerator(Generator):
         self._validate_inlined_recursion()
         title = self.api_title or str(sv.schema.name) or "API"
 
-        info = Info(title=title, version=self.api_version)
+        # Spec objects are built with ``model_construct`` throughout: every
+        # value handed to them is produced by this module and already has
+        # the right type, so pydantic validation is pure overhead (it was
+        # most of the cost of the operation builders). The models still give
+        # attribute access while the spec is patched, and the canonical field
+        # order on dump. Nothing re-checks caller-supplied options either: a
+        # non-str `api_version` is written to the output as-is.
+        info = Info.model_construct(title=title, version=self.api_version)
         if sv.schema.description:
             info.description = sv.schema.description
         if self.profile:
@@ -431,16 +614,15 @@ class OpenAPIGenerator(Generator):
         # Slot-walking happens once per class inside `_class_to_schema`; the
         # same walk also records any slot_uri values for
         # `_inject_rdf_extensions` to consume.
-        for class_name in sv.all_classes():
+        for class_name in self._all_class_names():
             if class_name in self._excluded_classes:
                 continue
-            cls = sv.get_class(class_name)
+            cls = self._get_class(class_name)
             self._record_rdf_class_uri(cls)
             schemas[class_name] = self._class_to_schema(cls)
 
         # Enum schemas
-        for enum_name in sv.all_enums():
-            enum_def = sv.get_enum(enum_name)
+        for enum_name, enum_def in sv.all_enums().items():
             schemas[enum_name] = self._enum_to_schema(enum_def)
 
         # Synthesise the RFC 7807 Problem schema when no custom error class
@@ -451,7 +633,7 @@ class OpenAPIGenerator(Generator):
         # class in the schema (a user-defined class already produced its
         # own component) versus an auto-name we own.
         if self._error_class_name and self._error_class_name not in schemas:
-            user_defined = self.schemaview.get_class(self._error_class_name) is not None
+            user_defined = self._get_class(self._error_class_name) is not None
             if not user_defined:
                 schemas[self._error_class_name] = self._build_problem_schema(self._error_class_name)
 
@@ -467,7 +649,7 @@ class OpenAPIGenerator(Generator):
         # Build paths for resource classes
         paths: dict[str, PathItem] = {}
         for class_name in self._get_resource_classes():
-            cls = sv.get_class(class_name)
+            cls = self._get_class(class_name)
             path_vars = self._get_path_variables(cls)
             path_segment = self._get_path_segment(cls)
             operations = self._get_operations(cls)
@@ -488,7 +670,7 @@ class OpenAPIGenerator(Generator):
             # makes the deep-nested URL the only canonical surface.
             if not nested_only:
                 collection_path = f"/{path_segment}"
-                collection_item = PathItem()
+                collection_item = PathItem.model_construct()
                 if OP_LIST in operations:
                     collection_item.get = self._make_list_operation(cls, class_name)
                 if OP_CREATE in operations:
@@ -506,7 +688,7 @@ class OpenAPIGenerator(Generator):
 
                 if not nested_only:
                     item_path = f"/{path_segment}/{item_suffix}"
-                    item = PathItem(parameters=path_params)
+                    item = PathItem.model_construct(parameters=path_params)
                     self._attach_item_operations(item, cls, class_name, operations)
                     paths[item_path] = item
 
@@ -576,12 +758,12 @@ class OpenAPIGenerator(Generator):
         # we build the model with 3.1.0 and then rewrite the version string
         # to self.openapi_version in serialize(). The 3.0.3 / 3.1.0 spec
         # bodies this generator emits are otherwise structurally identical.
-        return OpenAPI(
+        return OpenAPI.model_construct(
             openapi="3.1.0",
             info=info,
-            servers=[Server(url=self.server_url)],
+            servers=[Server.model_construct(url=self.server_url)],
             paths=paths,
-            components=Components(schemas=schemas),
+            components=Components.model_construct(schemas=schemas),
         )
 
     # --- Schema generation ---
@@ -640,7 +822,7 @@ class OpenAPIGenerator(Generator):
         ``flatten_inheritance``.
         """
         if cls.is_a and not self.flatten_inheritance:
-            parent_slots_by_name = {s.name: s for s in self._induced_slots_iter(cls.is_a)}
+            parent_slots_by_name = self._induced_slots_by_name(cls.is_a)
             local_properties: dict[str, Schema | Reference] = {}
             local_required: list[str] = []
             for slot in self._induced_slots_iter(cls.name):
@@ -663,21 +845,20 @@ class OpenAPIGenerator(Generator):
                     if slot.required:
                         local_required.append(slot.name)
 
-            local_schema = Schema(type=DataType.OBJECT, additionalProperties=False)
+            local_schema = Schema.model_construct(type=DataType.OBJECT, additionalProperties=False)
             if local_properties:
                 local_schema.properties = local_properties
             if local_required:
                 local_schema.required = local_required
 
-            schema = Schema(
+            return Schema.model_construct(
                 allOf=[
-                    Reference(ref=f"#/components/schemas/{cls.is_a}"),
+                    self._schema_ref(cls.is_a),
                     local_schema,
-                ]
+                ],
+                title=cls.name,
+                description=self._class_description(cls),
             )
-            schema.title = cls.name
-            schema.description = self._class_description(cls)
-            return schema
 
         # Flat schema: every induced slot (inherited and local) as a
         # top-level property. Used for non-inheriting classes and when
@@ -695,9 +876,12 @@ class OpenAPIGenerator(Generator):
             if slot.required:
                 required.append(slot.name)
 
-        schema = Schema(type=DataType.OBJECT, additionalProperties=False)
-        schema.title = cls.name
-        schema.description = self._class_description(cls)
+        schema = Schema.model_construct(
+            type=DataType.OBJECT,
+            additionalProperties=False,
+            title=cls.name,
+            description=self._class_description(cls),
+        )
         if properties:
             schema.properties = properties
         if required:
@@ -705,22 +889,44 @@ class OpenAPIGenerator(Generator):
         return schema
 
     def _slot_to_schema(self, slot: SlotDefinition) -> Schema | Reference:
-        """Convert a LinkML slot to a JSON Schema property."""
-        sv = self.schemaview
+        """Convert a LinkML slot to a JSON Schema property.
+
+        Memoised per build on the induced slot object: the same slot is
+        rendered for the component property, the PATCH body, path
+        parameters, and up to five query parameters. Keyed by identity
+        rather than name because ``slot_usage`` gives same-named slots a
+        different range / description per class. The returned model is
+        shared, so callers must not mutate it.
+        """
+        cache = getattr(self, "_slot_schema_cache", None)
+        if cache is None:
+            cache = {}
+            self._slot_schema_cache = cache
+        hit = cache.get(id(slot))
+        # The slot is stored alongside its schema so a recycled id()
+        # (ad-hoc SlotDefinitions outside the induced cache) never aliases.
+        if hit is not None and hit[0] is slot:
+            return hit[1]
+        schema = self._build_slot_schema(slot)
+        cache[id(slot)] = (slot, schema)
+        return schema
+
+    def _build_slot_schema(self, slot: SlotDefinition) -> Schema | Reference:
+        """Uncached body of :meth:`_slot_to_schema`."""
         range_name = slot.range or "string"
 
         # Determine the base schema/ref
-        if sv.get_class(range_name) or sv.get_enum(range_name):
+        if range_name in self._class_name_set() or range_name in self._enum_names():
             ref = self._class_range_ref(slot, range_name)
             if slot.multivalued:
-                base = Schema(type=DataType.ARRAY, items=ref)
+                base = Schema.model_construct(type=DataType.ARRAY, items=ref)
             else:
                 base = ref
         else:
-            type_info = RANGE_TYPE_MAP.get(range_name, {"type": DataType.STRING})
-            inner = Schema(**type_info)
+            type_info = RANGE_TYPE_MAP.get(range_name, _DEFAULT_RANGE_TYPE)
+            inner = Schema.model_construct(**type_info)
             if slot.multivalued:
-                base = Schema(type=DataType.ARRAY, items=inner)
+                base = Schema.model_construct(type=DataType.ARRAY, items=inner)
             else:
                 base = inner
 
@@ -734,7 +940,7 @@ class OpenAPIGenerator(Generator):
         slot_description = self._slot_description(slot)
         if isinstance(base, Reference) and (slot_description or has_extras):
             # Wrap in allOf to add constraints alongside a $ref
-            schema = Schema(allOf=[base])
+            schema = Schema.model_construct(allOf=[base])
             if slot_description:
                 schema.description = slot_description
             return schema
@@ -796,7 +1002,7 @@ class OpenAPIGenerator(Generator):
         `format: uri` typing.
         """
         if mode == "slug":
-            schema = Schema(type=DataType.STRING)
+            schema = Schema.model_construct(type=DataType.STRING)
             if slot.description:
                 schema.description = slot.description
             return schema
@@ -804,7 +1010,7 @@ class OpenAPIGenerator(Generator):
 
     def _enum_to_schema(self, enum_def) -> Schema:
         """Convert a LinkML enum to a JSON Schema enum."""
-        schema = Schema(type=DataType.STRING)
+        schema = Schema.model_construct(type=DataType.STRING)
         schema.title = enum_def.name
         if enum_def.description:
             schema.description = enum_def.description
@@ -816,15 +1022,30 @@ class OpenAPIGenerator(Generator):
 
     # --- Resource/path helpers ---
 
-    @staticmethod
-    def _class_annotation(cls: ClassDefinition, tag: str) -> str | None:
+    def _class_annotation(self, cls: ClassDefinition, tag: str) -> str | None:
         """Read a single class-level annotation value, or None if absent."""
-        if not cls.annotations:
-            return None
-        for ann in cls.annotations.values():
-            if ann.tag == tag:
-                return str(ann.value)
-        return None
+        return self._class_annotations(cls).get(tag)
+
+    def _class_annotations(self, cls: ClassDefinition) -> dict[str, str]:
+        """Per-build cache of a class's annotations as ``{tag: str(value)}``.
+
+        Resource-path emission reads half a dozen ``openapi.*`` tags off
+        every resource class (path, operations, tag, path_id, media
+        types, …), each of which used to re-scan ``cls.annotations``.
+        """
+        cache = getattr(self, "_class_annotations_cache", None)
+        if cache is None:
+            cache = {}
+            self._class_annotations_cache = cache
+        anns = cache.get(cls.name)
+        if anns is None:
+            anns = (
+                {ann.tag: str(ann.value) for ann in cls.annotations.values()}
+                if cls.annotations
+                else {}
+            )
+            cache[cls.name] = anns
+        return anns
 
     def _get_resource_classes(self) -> list[str]:
         """Determine which classes should have REST endpoints.
@@ -840,31 +1061,30 @@ class OpenAPIGenerator(Generator):
         cached = getattr(self, "_resource_classes_cache", None)
         if cached is not None:
             return cached
-        sv = self.schemaview
         excluded = self._excluded_classes
 
         if self.resource_filter:
             result = [c for c in self.resource_filter if c not in excluded]
         else:
-            annotated = [
-                name
-                for name in sv.all_classes()
-                if name not in excluded
-                and _is_truthy(
-                    self._class_annotation(sv.get_class(name), "openapi.resource") or False
-                )
-            ]
+            # One pass: collect annotated resources, and — until the
+            # first annotated class shows up — the concrete classes the
+            # auto-detect fallback would consider.
+            annotated: list[str] = []
+            candidates: list[str] = []
+            for name in self._all_class_names():
+                if name in excluded:
+                    continue
+                cls = self._get_class(name)
+                if _is_truthy(self._class_annotation(cls, "openapi.resource") or False):
+                    annotated.append(name)
+                elif not annotated and not cls.abstract and not cls.mixin:
+                    candidates.append(name)
             if annotated:
                 result = annotated
             else:
-                result = [
-                    name
-                    for name in sv.all_classes()
-                    if name not in excluded
-                    and not sv.get_class(name).abstract
-                    and not sv.get_class(name).mixin
-                    and list(self._induced_slots_iter(name))
-                ]
+                # Slot-less classes have nothing to serve. The induced
+                # slots are cached, so the emptiness test is a dict check.
+                result = [name for name in candidates if self._induced_slots_by_name(name)]
         self._resource_classes_cache = result
         return result
 
@@ -892,11 +1112,69 @@ class OpenAPIGenerator(Generator):
             cache[class_name] = cached
         return cached
 
+    def _all_class_names(self) -> list[str]:
+        """Per-build cache of ``sv.all_classes()`` materialised as a list."""
+        names = getattr(self, "_class_names_cache", None)
+        if names is None:
+            names = list(self.schemaview.all_classes())
+            self._class_names_cache = names
+        return names
+
+    def _class_name_set(self) -> frozenset[str]:
+        """Per-build set view of :meth:`_all_class_names`, for range classification."""
+        names = getattr(self, "_class_name_set_cache", None)
+        if names is None:
+            names = frozenset(self._all_class_names())
+            self._class_name_set_cache = names
+        return names
+
+    def _enum_names(self) -> frozenset[str]:
+        """Per-build cache of ``sv.all_enums()`` names, for range classification."""
+        names = getattr(self, "_enum_names_cache", None)
+        if names is None:
+            names = frozenset(self.schemaview.all_enums())
+            self._enum_names_cache = names
+        return names
+
+    def _get_class(self, class_name: str) -> ClassDefinition | None:
+        """Per-build memo of ``sv.get_class``; misses (scalar ranges) cache as None.
+
+        Lazily allocated for the same reason as
+        :meth:`_induced_slots_by_name`.
+        """
+        cache = getattr(self, "_class_def_cache", None)
+        if cache is None:
+            cache = {}
+            self._class_def_cache = cache
+        if class_name in cache:
+            return cache[class_name]
+        cls = self.schemaview.get_class(class_name)
+        cache[class_name] = cls
+        return cls
+
     def _induced_slots_iter(self, class_name: str):
         """Cached iteration order matching ``class_induced_slots`` semantics."""
         return self._induced_slots_by_name(class_name).values()
 
     def _get_slot_annotation(self, cls: ClassDefinition, slot_name: str, tag: str) -> str | None:
+        """Per-build memo of :meth:`_resolve_slot_annotation`.
+
+        The same ``(class, slot, tag)`` triple is asked for by the schema
+        builder, the path-variable scan, the query-param walk, and the
+        nested-path emitters; the three-step resolution only runs once.
+        """
+        cache = getattr(self, "_slot_annotation_cache", None)
+        if cache is None:
+            cache = {}
+            self._slot_annotation_cache = cache
+        key = (cls.name, slot_name, tag)
+        if key not in cache:
+            cache[key] = self._resolve_slot_annotation(cls, slot_name, tag)
+        return cache[key]
+
+    def _resolve_slot_annotation(
+        self, cls: ClassDefinition, slot_name: str, tag: str
+    ) -> str | None:
         """Read a slot annotation, walking the same inheritance chain LinkML does.
 
         Resolution order (most specific wins):
@@ -911,19 +1189,9 @@ class OpenAPIGenerator(Generator):
         3. The top-level slot definition (global default; same as today).
         """
         # 1. Direct slot_usage on the class.
-        if cls.slot_usage:
-            for su in (
-                cls.slot_usage.values() if isinstance(cls.slot_usage, dict) else cls.slot_usage
-            ):
-                su_obj = su if not isinstance(su, str) else None
-                if su_obj and getattr(su_obj, "name", None) == slot_name:
-                    annotations = getattr(su_obj, "annotations", None)
-                    if annotations:
-                        for ann in (
-                            annotations.values() if isinstance(annotations, dict) else [annotations]
-                        ):
-                            if hasattr(ann, "tag") and ann.tag == tag:
-                                return str(ann.value)
+        direct = self._slot_usage_annotations(cls).get(slot_name)
+        if direct and tag in direct:
+            return direct[tag]
         sv = self.schemaview
         # 2. Induced slot annotations — picks up slot_usage inherited from
         # ancestor classes through the is_a chain. Cached by class name
@@ -950,6 +1218,38 @@ class OpenAPIGenerator(Generator):
                     return str(ann.value)
         return None
 
+    def _slot_usage_annotations(self, cls: ClassDefinition) -> dict[str, dict[str, str]]:
+        """Per-build index of the class's direct ``slot_usage`` annotations.
+
+        Maps slot name → ``{tag: value}`` so step 1 of
+        :meth:`_resolve_slot_annotation` is a dict lookup instead of a
+        scan over every ``slot_usage`` entry and its annotations.
+        """
+        cache = getattr(self, "_slot_usage_annotations_cache", None)
+        if cache is None:
+            cache = {}
+            self._slot_usage_annotations_cache = cache
+        index = cache.get(cls.name)
+        if index is not None:
+            return index
+        index = {}
+        if cls.slot_usage:
+            for su in (
+                cls.slot_usage.values() if isinstance(cls.slot_usage, dict) else cls.slot_usage
+            ):
+                if isinstance(su, str):
+                    continue
+                name = getattr(su, "name", None)
+                annotations = getattr(su, "annotations", None)
+                if not name or not annotations:
+                    continue
+                tags = index.setdefault(name, {})
+                for ann in annotations.values() if isinstance(annotations, dict) else [annotations]:
+                    if hasattr(ann, "tag"):
+                        tags.setdefault(ann.tag, str(ann.value))
+        cache[cls.name] = index
+        return index
+
     @staticmethod
     def _path_variable_mode(value: str | None) -> str | None:
         """Normalize openapi.path_variable values.
@@ -1106,8 +1406,8 @@ class OpenAPIGenerator(Generator):
             return name
         if _is_truthy(self._schema_annotation("openapi.path_split_camel") or "false"):
             # Acronym-aware: "XMLParser" → "XML-Parser" → "xml-parser"
-            name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1-\2", name)
-            name = re.sub(r"([a-z0-9])([A-Z])", r"\1-\2", name)
+            name = _ACRONYM_BOUNDARY_RE.sub(r"\1-\2", name)
+            name = _LOWER_UPPER_BOUNDARY_RE.sub(r"\1-\2", name)
             return name.replace("_", "-").lower()
         return name.replace("_", "-")
 
@@ -1134,7 +1434,7 @@ class OpenAPIGenerator(Generator):
             if override:
                 return override.strip()
         if slot.range:
-            range_cls = self.schemaview.get_class(slot.range)
+            range_cls = self._get_class(slot.range)
             if range_cls is not None:
                 range_path = self._class_annotation(range_cls, "openapi.path")
                 if range_path:
@@ -1245,7 +1545,7 @@ class OpenAPIGenerator(Generator):
         ``slot_usage`` overrides); the LinkML side already resolves
         slot_uri precedence. Omits slots with no ``slot_uri``.
         """
-        cls = self.schemaview.get_class(class_name)
+        cls = self._get_class(class_name)
         if cls is None:
             return {}
         resolved: dict[str, str] = {}
@@ -1264,14 +1564,14 @@ class OpenAPIGenerator(Generator):
         to (the range itself plus concrete descendants). Skips slots
         whose range is a scalar / enum / built-in type.
         """
-        cls = self.schemaview.get_class(class_name)
+        cls = self._get_class(class_name)
         if cls is None:
             return {}
         ranges: dict[str, list[str]] = {}
         for slot in self._induced_slots_iter(class_name):
             if not slot.range:
                 continue
-            range_cls = self.schemaview.get_class(slot.range)
+            range_cls = self._get_class(slot.range)
             if range_cls is None:
                 continue
             descendants = self._concrete_descendants_including_self(slot.range)
@@ -1311,17 +1611,42 @@ class OpenAPIGenerator(Generator):
     # --- Operation builders ------------------------------------------------
 
     def _content_for(
-        self, schema: Schema | Reference, media_types: list[str]
+        self, schema: Schema | Reference, media_types: list[str] | tuple[str, ...]
     ) -> dict[str, MediaType]:
-        """Build a `content` dict advertising the same schema under every media type."""
-        return {mt: MediaType(media_type_schema=schema) for mt in media_types}
+        """Build a `content` dict advertising the same schema under every media type.
+
+        Memoised per build by schema identity, like :meth:`_slot_to_schema`;
+        the returned dict is shared, so callers must not mutate it.
+        """
+        cache = getattr(self, "_content_cache", None)
+        if cache is None:
+            cache = {}
+            self._content_cache = cache
+        key = (id(schema), tuple(media_types))
+        hit = cache.get(key)
+        if hit is not None and hit[0] is schema:
+            return hit[1]
+        content = {mt: MediaType.model_construct(media_type_schema=schema) for mt in media_types}
+        cache[key] = (schema, content)
+        return content
 
     def _get_media_types(self, cls: ClassDefinition) -> list[str]:
-        """Read the openapi.media_types class annotation, defaulting to JSON only."""
-        raw = self._class_annotation(cls, "openapi.media_types")
-        if not raw:
-            return ["application/json"]
-        return _parse_csv(raw)
+        """Read the openapi.media_types class annotation, defaulting to JSON only.
+
+        Memoised per build by class name: every operation builder for the
+        class (and each nested / reference emitter targeting it) asks
+        again. The returned list is shared, so callers must not mutate it.
+        """
+        cache = getattr(self, "_media_types_cache", None)
+        if cache is None:
+            cache = {}
+            self._media_types_cache = cache
+        media_types = cache.get(cls.name)
+        if media_types is None:
+            raw = self._class_annotation(cls, "openapi.media_types")
+            media_types = _parse_csv(raw) if raw else ["application/json"]
+            cache[cls.name] = media_types
+        return media_types
 
     # --- Error model (RFC 7807) -------------------------------------------
 
@@ -1360,7 +1685,7 @@ class OpenAPIGenerator(Generator):
                 "Drop one to silence this warning.",
                 stacklevel=2,
             )
-        if self.schemaview.get_class(custom) is None:
+        if self._get_class(custom) is None:
             raise ValueError(
                 f"openapi.error_class refers to undefined class {custom!r}; "
                 "add the class to the schema or remove the annotation."
@@ -1443,11 +1768,10 @@ class OpenAPIGenerator(Generator):
         would be valid YAML but operationally broken. Surface that as a
         generation-time error.
         """
-        sv = self.schemaview
-        for class_name in sv.all_classes():
+        for class_name in self._all_class_names():
             if class_name in excluded_classes:
                 continue
-            cls = sv.get_class(class_name)
+            cls = self._get_class(class_name)
             for slot in self._induced_slots_iter(class_name):
                 if slot.name not in excluded_slots:
                     continue
@@ -1517,7 +1841,7 @@ class OpenAPIGenerator(Generator):
         body_ann = self._get_slot_annotation(cls, slot.name, "openapi.body")
         if body_ann is None or body_ann.strip().lower() != "false":
             return False
-        if not slot.range or self.schemaview.get_class(slot.range) is None:
+        if not slot.range or self._get_class(slot.range) is None:
             raise ValueError(
                 f'Slot {cls.name}.{slot.name!r} is annotated `openapi.body: "false"` '
                 f"but its range {slot.range!r} is not a class. The annotation only "
@@ -1540,7 +1864,7 @@ class OpenAPIGenerator(Generator):
         ``name`` becomes the schema's ``title``; callers pass the resolved
         ``openapi.error_class_name`` (e.g. ``"ProblemDetail"``).
         """
-        schema = Schema(type=DataType.OBJECT, additionalProperties=True)
+        schema = Schema.model_construct(type=DataType.OBJECT, additionalProperties=True)
         schema.title = name
         schema.description = (
             "RFC 7807 Problem Details for HTTP APIs. Default error response "
@@ -1548,26 +1872,26 @@ class OpenAPIGenerator(Generator):
             "per RFC 7807 §3.2."
         )
         schema.properties = {
-            "type": Schema(
+            "type": Schema.model_construct(
                 type=DataType.STRING,
                 format="uri",
                 default="about:blank",
                 description="A URI reference identifying the problem type.",
             ),
-            "title": Schema(
+            "title": Schema.model_construct(
                 type=DataType.STRING,
                 description="A short, human-readable summary of the problem type.",
             ),
-            "status": Schema(
+            "status": Schema.model_construct(
                 type=DataType.INTEGER,
                 format="int32",
                 description="The HTTP status code generated by the origin server.",
             ),
-            "detail": Schema(
+            "detail": Schema.model_construct(
                 type=DataType.STRING,
                 description="A human-readable explanation specific to this occurrence.",
             ),
-            "instance": Schema(
+            "instance": Schema.model_construct(
                 type=DataType.STRING,
                 format="uri",
                 description="A URI reference identifying this specific occurrence.",
@@ -1575,18 +1899,44 @@ class OpenAPIGenerator(Generator):
         }
         return schema
 
+    def _schema_ref(self, name: str) -> Reference:
+        """Shared ``$ref`` to ``#/components/schemas/<name>``, memoised per build."""
+        cache = getattr(self, "_schema_ref_cache", None)
+        if cache is None:
+            cache = {}
+            self._schema_ref_cache = cache
+        ref = cache.get(name)
+        if ref is None:
+            ref = Reference.model_construct(ref=f"#/components/schemas/{name}")
+            cache[name] = ref
+        return ref
+
     def _error_response(self, description: str) -> Response:
-        """Build a non-2xx Response, attaching the error body when enabled."""
+        """Build a non-2xx Response, attaching the error body when enabled.
+
+        Memoised per build by description. The returned model is shared
+        between operations, so callers must not mutate it.
+        """
+        cache = getattr(self, "_error_response_cache", None)
+        if cache is None:
+            cache = {}
+            self._error_response_cache = cache
+        response = cache.get(description)
+        if response is not None:
+            return response
         if not self._error_class_name:
-            return Response(description=description)
-        ref = Reference(ref=f"#/components/schemas/{self._error_class_name}")
-        return Response(
-            description=description,
-            content={
-                "application/json": MediaType(media_type_schema=ref),
-                "application/problem+json": MediaType(media_type_schema=ref),
-            },
-        )
+            response = Response.model_construct(description=description)
+        else:
+            ref = self._schema_ref(self._error_class_name)
+            response = Response.model_construct(
+                description=description,
+                content={
+                    "application/json": MediaType.model_construct(media_type_schema=ref),
+                    "application/problem+json": MediaType.model_construct(media_type_schema=ref),
+                },
+            )
+        cache[description] = response
+        return response
 
     # --- Discriminator / polymorphism -----------------------------------
 
@@ -1650,12 +2000,12 @@ class OpenAPIGenerator(Generator):
         if not override:
             return self._class_response_ref(class_name)
         target = override.strip()
-        if self.schemaview.get_class(target) is None:
+        if self._get_class(target) is None:
             raise ValueError(
                 f"Class {class_name!r} is annotated with a request-body class {target!r} "
                 "that is not defined in the schema. Add the class or drop the annotation."
             )
-        return Reference(ref=f"#/components/schemas/{target}")
+        return self._schema_ref(target)
 
     def _class_response_ref(self, class_name: str) -> Schema | Reference:
         """Schema or ``$ref`` for the ``class_name`` payload in a path op.
@@ -1671,24 +2021,25 @@ class OpenAPIGenerator(Generator):
         nested-collection responses — any place a class is the body
         shape of a path operation.
         """
-        sv = self.schemaview
         descendants = self._concrete_descendants_including_self(class_name)
         if len(descendants) <= 1:
-            return Reference(ref=f"#/components/schemas/{class_name}")
+            return self._schema_ref(class_name)
         # Codegen-friendly mode: ``$ref`` to the parent class schema.
         # The parent carries its own ``discriminator`` block (attached
         # in ``_apply_discriminators``) so codegens dispatch correctly
         # without inline ``oneOf`` at the use site (#64).
         if self.codegen_friendly:
-            return Reference(ref=f"#/components/schemas/{class_name}")
-        oneof = [Reference(ref=f"#/components/schemas/{n}") for n in descendants]
-        schema = Schema(oneOf=oneof)
+            return self._schema_ref(class_name)
+        oneof = [self._schema_ref(n) for n in descendants]
+        schema = Schema.model_construct(oneOf=oneof)
         field = self._inherited_discriminator_field(class_name)
         if field is not None:
             mapping = {
-                self._type_value(sv.get_class(n)): f"#/components/schemas/{n}" for n in descendants
+                self._type_value(self._get_class(n)): self._schema_ref(n).ref for n in descendants
             }
-            schema.discriminator = Discriminator(propertyName=field, mapping=mapping)
+            schema.discriminator = Discriminator.model_construct(
+                propertyName=field, mapping=mapping
+            )
         return schema
 
     def _validate_inlined_recursion(self) -> None:
@@ -1711,14 +2062,13 @@ class OpenAPIGenerator(Generator):
         Reference cycles (``inlined: false``) are fine: they're IRI
         strings on the wire, no expansion happens.
         """
-        sv = self.schemaview
 
         # Build the composition adjacency:  class → [(slot, range), ...]
         composition: dict[str, list[tuple[str, str]]] = {}
-        for class_name in sv.all_classes():
+        for class_name in self._all_class_names():
             edges: list[tuple[str, str]] = []
             for slot in self._induced_slots_iter(class_name):
-                if slot.range and sv.get_class(slot.range) and self._is_composition(slot):
+                if slot.range and self._get_class(slot.range) and self._is_composition(slot):
                     edges.append((slot.name, slot.range))
             if edges:
                 composition[class_name] = edges
@@ -1757,7 +2107,7 @@ class OpenAPIGenerator(Generator):
                 continue
             cycle_classes = {parent for parent, _, _ in cycle} | {child for _, _, child in cycle}
             if any(
-                self._class_annotation(sv.get_class(n), "openapi.recurse_max_depth") is not None
+                self._class_annotation(self._get_class(n), "openapi.recurse_max_depth") is not None
                 for n in cycle_classes
             ):
                 continue
@@ -1781,12 +2131,11 @@ class OpenAPIGenerator(Generator):
         polymorphic chains flatten so each concrete schema can pin its
         own discriminator without ``allOf`` intersection conflicts.
         """
-        sv = self.schemaview
         cur: ClassDefinition | None = cls
         while cur is not None:
             if self._discriminator_field(cur) is not None:
                 return True
-            cur = sv.get_class(cur.is_a) if cur.is_a else None
+            cur = self._get_class(cur.is_a) if cur.is_a else None
         return False
 
     def _inherited_discriminator_field(self, class_name: str) -> str | None:
@@ -1799,13 +2148,12 @@ class OpenAPIGenerator(Generator):
         property's ``oneOf`` can carry the same ``discriminator``
         block the schema-level emission already uses.
         """
-        sv = self.schemaview
-        cls = sv.get_class(class_name)
+        cls = self._get_class(class_name)
         while cls is not None:
             field = self._discriminator_field(cls)
             if field is not None:
                 return field
-            cls = sv.get_class(cls.is_a) if cls.is_a else None
+            cls = self._get_class(cls.is_a) if cls.is_a else None
         return None
 
     def _is_discriminator_root(self, cls: ClassDefinition, field: str) -> bool:
@@ -1818,7 +2166,7 @@ class OpenAPIGenerator(Generator):
         """
         if not cls.is_a:
             return True
-        parent_cls = self.schemaview.get_class(cls.is_a)
+        parent_cls = self._get_class(cls.is_a)
         if parent_cls is None:
             return True
         parent_field = self._discriminator_field(parent_cls)
@@ -1851,7 +2199,7 @@ class OpenAPIGenerator(Generator):
         sv = self.schemaview
         out: list[str] = []
         for name in sv.class_descendants(class_name, reflexive=False):
-            cls = sv.get_class(name)
+            cls = self._get_class(name)
             if cls is None or cls.abstract or cls.mixin:
                 continue
             out.append(name)
@@ -1867,7 +2215,7 @@ class OpenAPIGenerator(Generator):
         handled by :meth:`_concrete_descendants_excluding_self`.
         """
         descendants = self._concrete_descendants_excluding_self(class_name)
-        cls = self.schemaview.get_class(class_name)
+        cls = self._get_class(class_name)
         if cls is None or cls.abstract or cls.mixin:
             return descendants
         return [class_name] + descendants
@@ -1893,9 +2241,8 @@ class OpenAPIGenerator(Generator):
           - a single-value enum + default on every concrete descendant's
             local property block
         """
-        sv = self.schemaview
-        for class_name in sv.all_classes():
-            cls = sv.get_class(class_name)
+        for class_name in self._all_class_names():
+            cls = self._get_class(class_name)
             field = self._discriminator_field(cls)
             if field is None:
                 continue
@@ -1921,7 +2268,7 @@ class OpenAPIGenerator(Generator):
             if not cls.abstract and not cls.mixin and self._type_value(cls):
                 inject_candidates.insert(0, class_name)
             for sub_name in inject_candidates:
-                tv = self._type_value(sv.get_class(sub_name))
+                tv = self._type_value(self._get_class(sub_name))
                 if tv is None:
                     continue
                 if tv in seen:
@@ -1931,7 +2278,7 @@ class OpenAPIGenerator(Generator):
                         "across a discriminator group."
                     )
                 seen[tv] = sub_name
-                mapping[tv] = f"#/components/schemas/{sub_name}"
+                mapping[tv] = self._schema_ref(sub_name).ref
 
             for tv, sub_name in seen.items():
                 self._inject_subclass_type_value(schemas, sub_name, field, tv)
@@ -1944,7 +2291,7 @@ class OpenAPIGenerator(Generator):
             if self.codegen_friendly:
                 parent_schema = schemas.get(class_name)
                 if isinstance(parent_schema, Schema):
-                    parent_schema.discriminator = Discriminator(
+                    parent_schema.discriminator = Discriminator.model_construct(
                         propertyName=field, mapping=dict(mapping)
                     )
 
@@ -1978,7 +2325,7 @@ class OpenAPIGenerator(Generator):
                 if isinstance(part, Schema):
                     return part
             # No inline part — append one so we have somewhere to put properties
-            inline = Schema(type=DataType.OBJECT)
+            inline = Schema.model_construct(type=DataType.OBJECT)
             schema.allOf.append(inline)
             return inline
         return schema
@@ -2026,12 +2373,12 @@ class OpenAPIGenerator(Generator):
         # a constant default rather than a single-value enum (which it
         # otherwise materialises as a Java enum class) (#64).
         if self.codegen_friendly:
-            disc = Schema(
+            disc = Schema.model_construct(
                 type=DataType.STRING,
                 default=type_value,
             )
         else:
-            disc = Schema(
+            disc = Schema.model_construct(
                 type=DataType.STRING,
                 enum=[type_value],
                 default=type_value,
@@ -2078,8 +2425,7 @@ class OpenAPIGenerator(Generator):
         a universal property-renaming vendor extension, despite some
         documentation suggesting otherwise.
         """
-        sv = self.schemaview
-        cls = sv.get_class(class_name)
+        cls = self._get_class(class_name)
         if cls is None:
             return
         value = self._class_annotation(cls, "openapi.legacy_type_value")
@@ -2098,7 +2444,7 @@ class OpenAPIGenerator(Generator):
             return
         local = self._writable_local_schema(schema)
         properties = dict(local.properties or {})
-        properties[field] = Schema(
+        properties[field] = Schema.model_construct(
             type=DataType.STRING,
             enum=[value],
             default=value,
@@ -2113,17 +2459,18 @@ class OpenAPIGenerator(Generator):
 
     def _make_list_operation(self, cls: ClassDefinition, class_name: str) -> Operation:
         media_types = self._get_media_types(cls)
-        array_schema = Schema(
+        array_schema = Schema.model_construct(
             type=DataType.ARRAY,
             items=self._class_response_ref(class_name),
         )
-        return Operation(
-            summary=f"List {_to_path_segment(class_name).replace('_', ' ')}",
-            operationId=f"list_{_to_path_segment(class_name)}",
+        segment = _to_path_segment(class_name)
+        return Operation.model_construct(
+            summary=f"List {segment.replace('_', ' ')}",
+            operationId=f"list_{segment}",
             tags=[self._class_tag(class_name)],
             parameters=self._make_query_params(cls),
             responses={
-                "200": Response(
+                "200": Response.model_construct(
                     description=f"List of {class_name} objects",
                     content=self._content_for(array_schema, media_types),
                 )
@@ -2134,16 +2481,16 @@ class OpenAPIGenerator(Generator):
         media_types = self._get_media_types(cls)
         response_ref = self._class_response_ref(class_name)
         request_ref = self._request_body_ref(cls, class_name, op="create")
-        return Operation(
+        return Operation.model_construct(
             summary=f"Create a {class_name}",
             operationId=f"create_{_to_snake_case(class_name)}",
             tags=[self._class_tag(class_name)],
-            requestBody=RequestBody(
+            requestBody=RequestBody.model_construct(
                 required=True,
                 content=self._content_for(request_ref, media_types),
             ),
             responses={
-                "201": Response(
+                "201": Response.model_construct(
                     description=f"{class_name} created",
                     content=self._content_for(response_ref, media_types),
                 ),
@@ -2154,12 +2501,12 @@ class OpenAPIGenerator(Generator):
     def _make_read_operation(self, cls: ClassDefinition, class_name: str) -> Operation:
         media_types = self._get_media_types(cls)
         ref = self._class_response_ref(class_name)
-        return Operation(
+        return Operation.model_construct(
             summary=f"Get a {class_name}",
             operationId=f"get_{_to_snake_case(class_name)}",
             tags=[self._class_tag(class_name)],
             responses={
-                "200": Response(
+                "200": Response.model_construct(
                     description=f"{class_name} details",
                     content=self._content_for(ref, media_types),
                 ),
@@ -2171,16 +2518,16 @@ class OpenAPIGenerator(Generator):
         media_types = self._get_media_types(cls)
         response_ref = self._class_response_ref(class_name)
         request_ref = self._request_body_ref(cls, class_name, op="update")
-        return Operation(
+        return Operation.model_construct(
             summary=f"Update a {class_name}",
             operationId=f"update_{_to_snake_case(class_name)}",
             tags=[self._class_tag(class_name)],
-            requestBody=RequestBody(
+            requestBody=RequestBody.model_construct(
                 required=True,
                 content=self._content_for(request_ref, media_types),
             ),
             responses={
-                "200": Response(
+                "200": Response.model_construct(
                     description=f"{class_name} updated",
                     content=self._content_for(response_ref, media_types),
                 ),
@@ -2190,12 +2537,12 @@ class OpenAPIGenerator(Generator):
         )
 
     def _make_delete_operation(self, cls: ClassDefinition, class_name: str) -> Operation:
-        return Operation(
+        return Operation.model_construct(
             summary=f"Delete a {class_name}",
             operationId=f"delete_{_to_snake_case(class_name)}",
             tags=[self._class_tag(class_name)],
             responses={
-                "204": Response(description=f"{class_name} deleted"),
+                "204": Response.model_construct(description=f"{class_name} deleted"),
                 "404": self._error_response("Not found"),
             },
         )
@@ -2212,23 +2559,21 @@ class OpenAPIGenerator(Generator):
         """
         media_types = self._get_media_types(cls)
         full_ref = self._class_response_ref(class_name)
-        patch_ref = Reference(ref=f"#/components/schemas/{class_name}Patch")
-        return Operation(
+        patch_ref = self._schema_ref(f"{class_name}Patch")
+        return Operation.model_construct(
             summary=f"Patch a {class_name}",
             operationId=f"patch_{_to_snake_case(class_name)}",
             tags=[self._class_tag(class_name)],
-            requestBody=RequestBody(
+            requestBody=RequestBody.model_construct(
                 required=True,
-                content={
-                    "application/merge-patch+json": MediaType(media_type_schema=patch_ref),
-                },
+                content=self._content_for(patch_ref, _MERGE_PATCH_MEDIA_TYPES),
                 description=(
                     "Partial update per RFC 7396. Omit fields you don't want to change. "
                     "Sending null clears the field; sending a value sets it."
                 ),
             ),
             responses={
-                "200": Response(
+                "200": Response.model_construct(
                     description=f"{class_name} patched",
                     content=self._content_for(full_ref, media_types),
                 ),
@@ -2261,7 +2606,7 @@ class OpenAPIGenerator(Generator):
             if slot.slot_uri:
                 self._x_rdf_property[(patch_name, slot.name)] = sv.expand_curie(slot.slot_uri)
 
-        schema = Schema(type=DataType.OBJECT, additionalProperties=False)
+        schema = Schema.model_construct(type=DataType.OBJECT, additionalProperties=False)
         schema.title = patch_name
         schema.description = (
             f"Partial update for {class_name}. All fields optional; semantics "
@@ -2295,11 +2640,21 @@ class OpenAPIGenerator(Generator):
             )
 
     def _identifier_slot(self, class_name: str) -> SlotDefinition | None:
-        """Return the identifier slot of the class, or None if it has none."""
-        for slot in self._induced_slots_iter(class_name):
-            if slot.identifier:
-                return slot
-        return None
+        """Return the identifier slot of the class, or None if it has none.
+
+        Cached per build: ``_class_range_ref`` asks once per class-ranged
+        slot, and the nested-path and chain emitters ask again per hop.
+        """
+        cache = getattr(self, "_identifier_slot_cache", None)
+        if cache is None:
+            cache = {}
+            self._identifier_slot_cache = cache
+        if class_name not in cache:
+            cache[class_name] = next(
+                (slot for slot in self._induced_slots_iter(class_name) if slot.identifier),
+                None,
+            )
+        return cache[class_name]
 
     @staticmethod
     def _is_composition(slot: SlotDefinition) -> bool:
@@ -2336,15 +2691,14 @@ class OpenAPIGenerator(Generator):
 
         Enum ranges always go through branch 3.
         """
-        sv = self.schemaview
-        target_cls = sv.get_class(range_name)
+        target_cls = self._get_class(range_name)
 
         if (
             target_cls is not None
             and not self._is_composition(slot)
             and self._identifier_slot(range_name) is not None
         ):
-            return Schema(type=DataType.STRING, schema_format="uri")
+            return Schema.model_construct(type=DataType.STRING, schema_format="uri")
 
         if target_cls is not None and self._is_composition(slot):
             descendants = self._concrete_descendants_including_self(range_name)
@@ -2353,24 +2707,26 @@ class OpenAPIGenerator(Generator):
                 # range — the parent's component schema carries the
                 # ``discriminator`` block (#64).
                 if self.codegen_friendly:
-                    return Reference(ref=f"#/components/schemas/{range_name}")
-                oneof = [Reference(ref=f"#/components/schemas/{n}") for n in descendants]
-                schema = Schema(oneOf=oneof)
+                    return self._schema_ref(range_name)
+                oneof = [self._schema_ref(n) for n in descendants]
+                schema = Schema.model_construct(oneOf=oneof)
                 field = self._inherited_discriminator_field(range_name)
                 if field is not None:
                     mapping = {
-                        self._type_value(sv.get_class(n)): f"#/components/schemas/{n}"
+                        self._type_value(self._get_class(n)): self._schema_ref(n).ref
                         for n in descendants
                     }
-                    schema.discriminator = Discriminator(propertyName=field, mapping=mapping)
+                    schema.discriminator = Discriminator.model_construct(
+                        propertyName=field, mapping=mapping
+                    )
                 return schema
 
-        return Reference(ref=f"#/components/schemas/{range_name}")
+        return self._schema_ref(range_name)
 
     @staticmethod
     def _build_resource_link_schema() -> Schema:
         """The shared body schema for reference attach operations."""
-        schema = Schema(type=DataType.OBJECT)
+        schema = Schema.model_construct(type=DataType.OBJECT)
         schema.title = "ResourceLink"
         schema.description = (
             "A reference to another resource by IRI. Body shape for attach "
@@ -2378,7 +2734,7 @@ class OpenAPIGenerator(Generator):
         )
         schema.required = ["id"]
         schema.properties = {
-            "id": Schema(
+            "id": Schema.model_construct(
                 type=DataType.STRING,
                 format="uri",
                 description="IRI of the linked resource.",
@@ -2399,7 +2755,7 @@ class OpenAPIGenerator(Generator):
                 annotations:
                   openapi.path_id: catalogId   # → {catalogId} in URLs
         """
-        cls = self.schemaview.get_class(class_name)
+        cls = self._get_class(class_name)
         override = self._class_annotation(cls, "openapi.path_id") if cls else None
         if override:
             return override.strip()
@@ -2423,7 +2779,7 @@ class OpenAPIGenerator(Generator):
         Without ``parent_path``, ``nested_only`` only suppresses the
         flat top-level path (today's behaviour for unannotated chains).
         """
-        target_cls = self.schemaview.get_class(target_class_name)
+        target_cls = self._get_class(target_class_name)
         if target_cls is None:
             return False
         nested_only = _is_truthy(self._class_annotation(target_cls, "openapi.nested_only") or False)
@@ -2437,7 +2793,7 @@ class OpenAPIGenerator(Generator):
         if "." not in first_hop:
             return False
         canonical_root_class = first_hop.split(".", 1)[0].strip()
-        root_cls = self.schemaview.get_class(canonical_root_class)
+        root_cls = self._get_class(canonical_root_class)
         if root_cls is None:
             return False
         root_segment = self._get_path_segment(root_cls)
@@ -2449,7 +2805,7 @@ class OpenAPIGenerator(Generator):
         Defaults to the class name (current behaviour); the
         ``openapi.tag`` class annotation overrides it.
         """
-        cls = self.schemaview.get_class(class_name)
+        cls = self._get_class(class_name)
         override = self._class_annotation(cls, "openapi.tag") if cls else None
         if override:
             return override.strip()
@@ -2477,12 +2833,12 @@ class OpenAPIGenerator(Generator):
            target-level signal is present.
         """
         if slot is not None:
-            parent_cls = self.schemaview.get_class(parent_class_name)
+            parent_cls = self._get_class(parent_class_name)
             slot_tag = self._get_slot_annotation(parent_cls, slot.name, "openapi.tag")
             if slot_tag:
                 return slot_tag.strip()
         if target_class_name:
-            target_cls = self.schemaview.get_class(target_class_name)
+            target_cls = self._get_class(target_class_name)
             target_tag = self._class_annotation(target_cls, "openapi.tag") if target_cls else None
             if target_tag:
                 return target_tag.strip()
@@ -2505,7 +2861,7 @@ class OpenAPIGenerator(Generator):
         the slot name (preserving byte-identical output for existing
         schemas).
         """
-        cls = self.schemaview.get_class(class_name)
+        cls = self._get_class(class_name)
         path_id_override: str | None = None
         if len(path_vars) == 1 and cls is not None:
             raw = self._class_annotation(cls, "openapi.path_id")
@@ -2513,7 +2869,7 @@ class OpenAPIGenerator(Generator):
         names = [path_id_override or slot.name for slot, _mode in path_vars]
         item_suffix = "/".join(f"{{{name}}}" for name in names)
         path_params = [
-            Parameter(
+            Parameter.model_construct(
                 name=name,
                 param_in=ParameterLocation.PATH,
                 required=True,
@@ -2599,8 +2955,7 @@ class OpenAPIGenerator(Generator):
         prefix references, so the resulting `PathItem` lists them at the
         path level.
         """
-        sv = self.schemaview
-        parent_cls = sv.get_class(parent_class_name)
+        parent_cls = self._get_class(parent_class_name)
         out: dict[str, PathItem] = {}
 
         for slot in self._induced_slots_iter(parent_class_name):
@@ -2609,7 +2964,7 @@ class OpenAPIGenerator(Generator):
             if self._is_slot_excluded(slot):
                 continue
             target_name = slot.range
-            if not target_name or sv.get_class(target_name) is None:
+            if not target_name or self._get_class(target_name) is None:
                 continue  # primitive, enum, or unresolved range
 
             # Opt-out: a slot may carry `openapi.nested: "false"` to suppress
@@ -2686,13 +3041,12 @@ class OpenAPIGenerator(Generator):
         ``TargetClass``. Excluded source classes and excluded slot names
         are skipped so the index reflects the active profile.
         """
-        sv = self.schemaview
         index: dict[str, list[tuple[str, str]]] = {}
         # Cache target_class_name → set of its existing slot names so we
         # don't rebuild it once per declaration.
         target_slot_names_cache: dict[str, set[str]] = {}
         seen_per_target: dict[str, set[str]] = {}
-        for src_class_name in sv.all_classes():
+        for src_class_name in self._all_class_names():
             if src_class_name in self._excluded_classes:
                 continue
             for slot in self._induced_slots_iter(src_class_name):
@@ -2745,7 +3099,7 @@ class OpenAPIGenerator(Generator):
                     op.operationId = existing + suffix
 
     def _canonical_parent_chain(self, class_name: str) -> list[tuple[str, str]]:
-        cls = self.schemaview.get_class(class_name)
+        cls = self._get_class(class_name)
         annotated = self._class_annotation(cls, "openapi.parent_path") if cls else None
         return canonical_parent_chain(class_name, self._parent_chains_index, annotated)
 
@@ -2766,7 +3120,6 @@ class OpenAPIGenerator(Generator):
         """
         if not chain:
             return "", []
-        sv = self.schemaview
         prefix_parts: list[str] = []
         params: list[Parameter] = []
         for i, (parent_name, slot_name) in enumerate(chain):
@@ -2780,7 +3133,7 @@ class OpenAPIGenerator(Generator):
                     "parameter."
                 )
             param_name = self._class_path_id_name(parent_name)
-            parent_cls = sv.get_class(parent_name)
+            parent_cls = self._get_class(parent_name)
             slot_def = self._induced_slots_by_name(parent_name).get(slot_name)
             slot_segment = (
                 self._render_slot_segment(parent_cls, slot_def)
@@ -2793,7 +3146,7 @@ class OpenAPIGenerator(Generator):
             else:
                 prefix_parts.append(f"{{{param_name}}}/{slot_segment}")
             params.append(
-                Parameter(
+                Parameter.model_construct(
                     name=param_name,
                     param_in=ParameterLocation.PATH,
                     required=True,
@@ -2821,7 +3174,7 @@ class OpenAPIGenerator(Generator):
         """
         chain_prefix, chain_params = self._build_chain_path_params(chain)
         deep_item_path = f"/{chain_prefix}/{item_suffix}"
-        deep_item = PathItem(parameters=list(chain_params) + path_params)
+        deep_item = PathItem.model_construct(parameters=list(chain_params) + path_params)
         self._attach_item_operations(deep_item, cls, class_name, operations)
         chain_suffix = "_via_" + "_".join(_to_snake_case(p) for p, _ in chain)
         deep_paths = {deep_item_path: deep_item}
@@ -2872,7 +3225,6 @@ class OpenAPIGenerator(Generator):
         with ``openapi.path_template_collection: "false"`` for legacy
         item-only URLs.
         """
-        sv = self.schemaview
         sources_raw = self._class_annotation(cls, "openapi.path_param_sources") or ""
         sources = self._parse_path_param_sources(class_name, sources_raw)
         placeholders = list(self._PATH_TEMPLATE_PLACEHOLDER_RE.findall(template))
@@ -2903,7 +3255,7 @@ class OpenAPIGenerator(Generator):
         params_by_name: dict[str, Parameter] = {}
         for name in unique_placeholders:
             src_class, src_slot = sources[name]
-            if sv.get_class(src_class) is None:
+            if self._get_class(src_class) is None:
                 raise ValueError(
                     f"Class {class_name!r} `openapi.path_param_sources` "
                     f"refers to unknown class {src_class!r} for "
@@ -2916,14 +3268,16 @@ class OpenAPIGenerator(Generator):
                     f"refers to unknown slot {src_class}.{src_slot!r} for "
                     f"parameter {name!r}."
                 )
-            params_by_name[name] = Parameter(
+            params_by_name[name] = Parameter.model_construct(
                 name=name,
                 param_in=ParameterLocation.PATH,
                 required=True,
                 param_schema=self._slot_to_schema(slot),
             )
 
-        deep_item = PathItem(parameters=[params_by_name[n] for n in unique_placeholders])
+        deep_item = PathItem.model_construct(
+            parameters=[params_by_name[n] for n in unique_placeholders]
+        )
         self._attach_item_operations(deep_item, cls, class_name, operations)
         deep_paths: dict[str, PathItem] = {template: deep_item}
 
@@ -2943,7 +3297,7 @@ class OpenAPIGenerator(Generator):
                     collection_params = [
                         params_by_name[n] for n in unique_placeholders if n != tail_name
                     ]
-                    collection = PathItem(
+                    collection = PathItem.model_construct(
                         parameters=list(collection_params) if collection_params else None
                     )
                     if OP_LIST in operations:
@@ -2988,38 +3342,40 @@ class OpenAPIGenerator(Generator):
         # collection at the canonical depth.
         if self._suppress_non_canonical_nested(target_class_name, collection_path):
             return
-        target_cls = self.schemaview.get_class(target_class_name)
+        target_cls = self._get_class(target_class_name)
         media_types = self._get_media_types(target_cls)
         target_ref = self._class_response_ref(target_class_name)
-        array_schema = Schema(type=DataType.ARRAY, items=target_ref)
+        array_schema = Schema.model_construct(type=DataType.ARRAY, items=target_ref)
         # Nested composition op tag: slot's `openapi.tag` →
         # target class's explicit `openapi.tag` → parent class's tag
         # (#86 layers explicit target-side override on top of #68).
         op_tag = self._nested_op_tag(parent_class_name, target_class_name, slot)
-        slot_seg = slot.name
-
-        collection = PathItem(parameters=list(parent_path_params))
-        collection.get = Operation(
-            summary=f"List {target_class_name} composed in {parent_class_name}.{slot.name}",
-            operationId=f"list_{_to_snake_case(parent_class_name)}_{slot_seg}",
+        # operationId stem and summary suffix shared by every op below.
+        op_stem = f"{_to_snake_case(parent_class_name)}_{slot.name}"
+        relation = f"{parent_class_name}.{slot.name}"
+
+        collection = PathItem.model_construct(parameters=list(parent_path_params))
+        collection.get = Operation.model_construct(
+            summary=f"List {target_class_name} composed in {relation}",
+            operationId=f"list_{op_stem}",
             tags=[op_tag],
             responses={
-                "200": Response(
+                "200": Response.model_construct(
                     description=f"{target_class_name} list",
                     content=self._content_for(array_schema, media_types),
                 ),
                 "404": self._error_response("Parent not found"),
             },
         )
-        collection.post = Operation(
-            summary=f"Create a {target_class_name} in {parent_class_name}.{slot.name}",
-            operationId=f"create_{_to_snake_case(parent_class_name)}_{slot_seg}",
+        collection.post = Operation.model_construct(
+            summary=f"Create a {target_class_name} in {relation}",
+            operationId=f"create_{op_stem}",
             tags=[op_tag],
-            requestBody=RequestBody(
+            requestBody=RequestBody.model_construct(
                 required=True, content=self._content_for(target_ref, media_types)
             ),
             responses={
-                "201": Response(
+                "201": Response.model_construct(
                     description=f"{target_class_name} created",
                     content=self._content_for(target_ref, media_types),
                 ),
@@ -3037,35 +3393,35 @@ class OpenAPIGenerator(Generator):
         item_var = self._nested_item_path_var(target_class_name)
         item_path = f"{collection_path}/{{{item_var}}}"
         item_path_params = list(parent_path_params) + [
-            Parameter(
+            Parameter.model_construct(
                 name=item_var,
                 param_in=ParameterLocation.PATH,
                 required=True,
                 param_schema=self._slot_to_schema(target_id_slot),
             )
         ]
-        item = PathItem(parameters=item_path_params)
-        item.get = Operation(
-            summary=f"Get a {target_class_name} from {parent_class_name}.{slot.name}",
-            operationId=f"get_{_to_snake_case(parent_class_name)}_{slot_seg}_item",
+        item = PathItem.model_construct(parameters=item_path_params)
+        item.get = Operation.model_construct(
+            summary=f"Get a {target_class_name} from {relation}",
+            operationId=f"get_{op_stem}_item",
             tags=[op_tag],
             responses={
-                "200": Response(
+                "200": Response.model_construct(
                     description=f"{target_class_name} details",
                     content=self._content_for(target_ref, media_types),
                 ),
                 "404": self._error_response("Not found"),
             },
         )
-        item.put = Operation(
-            summary=f"Replace a {target_class_name} in {parent_class_name}.{slot.name}",
-            operationId=f"replace_{_to_snake_case(parent_class_name)}_{slot_seg}_item",
+        item.put = Operation.model_construct(
+            summary=f"Replace a {target_class_name} in {relation}",
+            operationId=f"replace_{op_stem}_item",
             tags=[op_tag],
-            requestBody=RequestBody(
+            requestBody=RequestBody.model_construct(
                 required=True, content=self._content_for(target_ref, media_types)
             ),
             responses={
-                "200": Response(
+                "200": Response.model_construct(
                     description=f"{target_class_name} replaced",
                     content=self._content_for(target_ref, media_types),
                 ),
@@ -3073,12 +3429,12 @@ class OpenAPIGenerator(Generator):
                 "422": self._error_response("Validation error"),
             },
         )
-        item.delete = Operation(
-            summary=f"Delete a {target_class_name} from {parent_class_name}.{slot.name}",
-            operationId=f"delete_{_to_snake_case(parent_class_name)}_{slot_seg}_item",
+        item.delete = Operation.model_construct(
+            summary=f"Delete a {target_class_name} from {relation}",
+            operationId=f"delete_{op_stem}_item",
             tags=[op_tag],
             responses={
-                "204": Response(description=f"{target_class_name} deleted"),
+                "204": Response.model_construct(description=f"{target_class_name} deleted"),
                 "404": self._error_response("Not found"),
             },
         )
@@ -3112,8 +3468,7 @@ class OpenAPIGenerator(Generator):
         resource at the top level and don't need a deeper URL prefix.
         Honours ``openapi.nested: "false"`` and profile exclusions.
         """
-        sv = self.schemaview
-        target_cls = sv.get_class(target_class_name)
+        target_cls = self._get_class(target_class_name)
         if target_cls is None:
             return
         for child_slot in self._induced_slots_iter(target_class_name):
@@ -3122,7 +3477,7 @@ class OpenAPIGenerator(Generator):
             if self._is_slot_excluded(child_slot):
                 continue
             child_target = child_slot.range
-            if not child_target or sv.get_class(child_target) is None:
+            if not child_target or self._get_class(child_target) is None:
                 continue
             nested_ann = self._get_slot_annotation(target_cls, child_slot.name, "openapi.nested")
             if nested_ann is not None and not _is_truthy(nested_ann):
@@ -3163,42 +3518,50 @@ class OpenAPIGenerator(Generator):
                 "or add an identifier to the target class."
             )
 
-        target_cls = self.schemaview.get_class(target_class_name)
+        target_cls = self._get_class(target_class_name)
         media_types = self._get_media_types(target_cls)
         target_ref = self._class_response_ref(target_class_name)
-        array_schema = Schema(type=DataType.ARRAY, items=target_ref)
+        array_schema = Schema.model_construct(type=DataType.ARRAY, items=target_ref)
 
-        link_ref = Reference(ref="#/components/schemas/ResourceLink")
+        link_ref = self._schema_ref("ResourceLink")
         # Body accepts a single link or a batch — clients prefer batch.
-        link_body_schema = Schema(oneOf=[link_ref, Schema(type=DataType.ARRAY, items=link_ref)])
+        link_body_schema = Schema.model_construct(
+            oneOf=[link_ref, Schema.model_construct(type=DataType.ARRAY, items=link_ref)]
+        )
         # Reference attach/detach op tag follows the same precedence as
         # composition (#86 over #68).
         op_tag = self._nested_op_tag(parent_class_name, target_class_name, slot)
-        slot_seg = slot.name
-
-        collection = PathItem(parameters=list(parent_path_params))
-        collection.get = Operation(
-            summary=f"List {target_class_name} attached to {parent_class_name}.{slot.name}",
-            operationId=f"list_{_to_snake_case(parent_class_name)}_{slot_seg}",
+        # operationId stem and summary suffix shared by every op below.
+        op_stem = f"{_to_snake_case(parent_class_name)}_{slot.name}"
+        relation = f"{parent_class_name}.{slot.name}"
+
+        collection = PathItem.model_construct(parameters=list(parent_path_params))
+        collection.get = Operation.model_construct(
+            summary=f"List {target_class_name} attached to {relation}",
+            operationId=f"list_{op_stem}",
             tags=[op_tag],
             responses={
-                "200": Response(
+                "200": Response.model_construct(
                     description=f"{target_class_name} list",
                     content=self._content_for(array_schema, media_types),
                 ),
                 "404": self._error_response("Parent not found"),
             },
         )
-        collection.post = Operation(
-            summary=f"Attach {target_class_name} to {parent_class_name}.{slot.name}",
-            operationId=f"attach_{_to_snake_case(parent_class_name)}_{slot_seg}",
+        collection.post = Operation.model_construct(
+            summary=f"Attach {target_class_name} to {relation}",
+            operationId=f"attach_{op_stem}",
             tags=[op_tag],
-            requestBody=RequestBody(
+            requestBody=RequestBody.model_construct(
                 required=True,
-                content={"application/json": MediaType(media_type_schema=link_body_schema)},
+                content={
+                    "application/json": MediaType.model_construct(
+                        media_type_schema=link_body_schema
+                    )
+                },
             ),
             responses={
-                "204": Response(description="Attached"),
+                "204": Response.model_construct(description="Attached"),
                 "404": self._error_response("Parent or target not found"),
                 "422": self._error_response("Validation error"),
             },
@@ -3208,20 +3571,20 @@ class OpenAPIGenerator(Generator):
         item_var = self._nested_item_path_var(target_class_name)
         item_path = f"{collection_path}/{{{item_var}}}"
         item_path_params = list(parent_path_params) + [
-            Parameter(
+            Parameter.model_construct(
                 name=item_var,
                 param_in=ParameterLocation.PATH,
                 required=True,
                 param_schema=self._slot_to_schema(target_id_slot),
             )
         ]
-        item = PathItem(parameters=item_path_params)
-        item.delete = Operation(
-            summary=f"Detach {target_class_name} from {parent_class_name}.{slot.name}",
-            operationId=f"detach_{_to_snake_case(parent_class_name)}_{slot_seg}",
+        item = PathItem.model_construct(parameters=item_path_params)
+        item.delete = Operation.model_construct(
+            summary=f"Detach {target_class_name} from {relation}",
+            operationId=f"detach_{op_stem}",
             tags=[op_tag],
             responses={
-                "204": Response(description="Detached (target entity preserved)"),
+                "204": Response.model_construct(description="Detached (target entity preserved)"),
                 "404": self._error_response("Parent or attachment not found"),
             },
         )
@@ -3234,18 +3597,7 @@ class OpenAPIGenerator(Generator):
         `_query_params.walk_query_params`. This method only renders
         Parameter objects — wire shape stays unchanged.
         """
-        params: list[Parameter] = [
-            Parameter(
-                name="limit",
-                param_in=ParameterLocation.QUERY,
-                param_schema=Schema(type=DataType.INTEGER, default=100),
-            ),
-            Parameter(
-                name="offset",
-                param_in=ParameterLocation.QUERY,
-                param_schema=Schema(type=DataType.INTEGER, default=0),
-            ),
-        ]
+        params: list[Parameter] = list(_PAGING_PARAMS)
         surface = walk_query_params(
             self.schemaview,
             cls,
@@ -3256,46 +3608,51 @@ class OpenAPIGenerator(Generator):
             induced_slots=lambda name: list(self._induced_slots_iter(name)),
             get_slot_annotation=self._get_slot_annotation,
             get_class_annotation=self._class_annotation,
+            is_enum=self._enum_names().__contains__,
         )
         for spec in surface.params:
-            params.extend(self._render_query_param_for_spec(spec))
+            self._render_query_param_for_spec(spec, params)
         if surface.sort_tokens:
             params.append(self._make_sort_param(surface.sort_tokens))
         return params
 
-    def _render_query_param_for_spec(self, spec: QueryParamSpec) -> list[Parameter]:
-        """Render one QueryParamSpec into one or more Parameter objects.
+    def _render_query_param_for_spec(self, spec: QueryParamSpec, out: list[Parameter]) -> None:
+        """Render one QueryParamSpec into one or more Parameter objects on `out`.
 
         `equality` → single param. `comparable` → four `__gte`/`__lte`/
         `__gt`/`__lt` params. `sortable` doesn't produce a per-slot
         Parameter (it contributes to the shared `?sort=` array param built
-        by _make_sort_param).
+        by _make_sort_param). Appends straight onto the caller's list
+        rather than building a throwaway list per slot.
         """
-        out: list[Parameter] = []
-        if "equality" in spec.capabilities:
+        capabilities = spec.capabilities
+        if "equality" not in capabilities and "comparable" not in capabilities:
+            return
+        name = spec.slot.name
+        slot_schema = self._slot_to_schema(spec.slot)
+        if "equality" in capabilities:
             out.append(
-                Parameter(
-                    name=spec.slot.name,
+                Parameter.model_construct(
+                    name=name,
                     param_in=ParameterLocation.QUERY,
                     required=False,
-                    param_schema=self._slot_to_schema(spec.slot),
+                    param_schema=slot_schema,
                 )
             )
-        if "comparable" in spec.capabilities:
+        if "comparable" in capabilities:
             for op in ("gte", "lte", "gt", "lt"):
                 out.append(
-                    Parameter(
-                        name=f"{spec.slot.name}__{op}",
+                    Parameter.model_construct(
+                        name=f"{name}__{op}",
                         param_in=ParameterLocation.QUERY,
                         required=False,
-                        param_schema=self._slot_to_schema(spec.slot),
+                        param_schema=slot_schema,
                     )
                 )
-        return out
 
     @staticmethod
     def _make_sort_param(sort_tokens: list[str]) -> Parameter:
-        return Parameter(
+        return Parameter.model_construct(
             name="sort",
             param_in=ParameterLocation.QUERY,
             required=False,
@@ -3305,8 +3662,8 @@ class OpenAPIGenerator(Generator):
             ),
             style="form",
             explode=False,
-            param_schema=Schema(
+            param_schema=Schema.model_construct(
                 type=DataType.ARRAY,
-                items=Schema(type=DataType.STRING, enum=sort_tokens),
+                items=Schema.model_construct(type=DataType.STRING, enum=sort_tokens),
             ),
         )
@@ -12,6 +12,15 @@ Output: a tree of ``.java`` source files (DTOs + Spring controller
 interfaces) ready to drop into a Maven/Gradle Spring Boot project.
 """
 
-from linkml_openapi.spring.generator import SpringServerGenerator
-
 __all__ = ["SpringServerGenerator"]
+
+
+def __getattr__(name: str):
+    # Resolved lazily so importing `linkml_openapi.spring.cli` (and with
+    # it `gen-spring-server --help`) doesn't load pydantic, openapi_pydantic
+    # and linkml-runtime through the generator module.
+    if name == "SpringServerGenerator":
+        from linkml_openapi.spring.generator import SpringServerGenerator
+
+        return SpringServerGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,6 @@ from pathlib import Path
 import click
 
 from linkml_openapi import __version__
-from linkml_openapi.spring.generator import SpringServerGenerator
 
 
 @click.command(name="gen-spring-server")
@@ -78,6 +77,9 @@ def cli(
     reactive: bool | None,
 ) -> None:
     """Generate Spring server source files directly from a LinkML schema."""
+    # Deferred so `--help` / `--version` skip the generator's imports.
+    from linkml_openapi.spring.generator import SpringServerGenerator
+
     gen = SpringServerGenerator(
         yamlfile,
         package=package,
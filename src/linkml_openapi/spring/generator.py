@@ -30,6 +30,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
@@ -49,10 +50,17 @@ from linkml_openapi._chains import (
     render_chain_hops,
 )
 from linkml_openapi._query_params import QueryParamSpec, walk_query_params
-from linkml_openapi.generator import _to_snake_case
+from linkml_openapi.generator import (
+    _ACRONYM_BOUNDARY_RE,
+    _LOWER_UPPER_BOUNDARY_RE,
+    _to_snake_case,
+)
 
 _TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+_NON_JAVA_IDENTIFIER_RE = re.compile(r"[^A-Za-z0-9_]")
+_WORD_SEPARATOR_RE = re.compile(r"[_\-\s]+")
+
 
 _RANGE_TYPE_MAP: dict[str, tuple[str, str | None]] = {
     # (java_type, import_path or None)
@@ -113,6 +121,11 @@ class SpringServerGenerator:
     _sv: SchemaView = field(init=False)
     _env: Environment = field(init=False)
     _induced_slots_cache: dict[str, list[SlotDefinition]] = field(init=False, default_factory=dict)
+    _class_cache: dict[str, ClassDefinition | None] = field(init=False, default_factory=dict)
+    _identifier_slot_cache: dict[str, SlotDefinition | None] = field(
+        init=False, default_factory=dict
+    )
+    _class_annotations_cache: dict[str, dict[str, str]] = field(init=False, default_factory=dict)
 
     def __post_init__(self) -> None:
         self._sv = SchemaView(self.schema_path)
@@ -249,8 +262,10 @@ class SpringServerGenerator:
         # Pass the prefix through so the sidecar's `paths:` keys match
         # springdoc's runtime view (which is built from the live
         # class-level `@RequestMapping` + relative method mappings).
+        # Hand over the already-loaded SchemaView so the schema isn't
+        # parsed a second time.
         return OpenAPIGenerator(
-            self.schema_path,
+            self._sv,
             path_prefix=self._effective_path_prefix or None,
             path_style=self.path_style,
         ).serialize()
@@ -261,7 +276,7 @@ class SpringServerGenerator:
         package_path = self.package.replace(".", "/")
 
         for class_name in self._sv.all_classes():
-            cls = self._sv.get_class(class_name)
+            cls = self._get_class(class_name)
             if cls is None:
                 continue
             files[f"{package_path}/model/{class_name}.java"] = self._render_dto(cls)
@@ -329,7 +344,7 @@ public class %(class_name)s {
         # `extends`: parent class name (in same package, no import needed
         # because Java auto-imports same-package types).
         extends = cls.is_a if cls.is_a else None
-        if extends is not None and self._sv.get_class(extends) is None:
+        if extends is not None and self._get_class(extends) is None:
             extends = None  # external is_a not in this schema
 
         class_uri = self._expand_curie(cls.class_uri) if cls.class_uri else ""
@@ -466,7 +481,7 @@ public class %(class_name)s {
         ``@Validated`` runs them at request-binding time.
         """
         range_name = slot.range or "string"
-        target_cls = self._sv.get_class(range_name)
+        target_cls = self._get_class(range_name)
 
         if target_cls is not None:
             target_id = self._has_identifier(target_cls)
@@ -776,12 +791,12 @@ public class %(class_name)s {
         relation slots and we want the API surface to expose them
         consistently."""
         ops: list[dict] = []
-        for slot in self._sv.class_induced_slots(cls.name):
+        for slot in self._induced_slots(cls.name):
             if not slot.multivalued:
                 # Single-valued class refs live as fields in the parent
                 # body — no addressable collection at the URL surface.
                 continue
-            target = self._sv.get_class(slot.range or "")
+            target = self._get_class(slot.range or "")
             if target is None:
                 continue
             if not self._has_identifier(target):
@@ -1287,7 +1302,7 @@ public class %(class_name)s {
         Reuses _RANGE_TYPE_MAP. Class-ranged or enum-ranged slots fall back
         to String for query-param purposes."""
         range_name = slot.range or "string"
-        if self._sv.get_class(range_name) is not None:
+        if self._get_class(range_name) is not None:
             return "String"
         mapping = _RANGE_TYPE_MAP.get(range_name)
         if mapping is None:
@@ -1321,7 +1336,7 @@ public class %(class_name)s {
             raw = self._class_annotation(cur, "openapi.media_types")
             if raw:
                 return [m.strip() for m in raw.split(",") if m.strip()]
-            cur = self._sv.get_class(cur.is_a) if cur.is_a else None
+            cur = self._get_class(cur.is_a) if cur.is_a else None
         return ["application/json"]
 
     def _resolve_path_style(self) -> str:
@@ -1360,8 +1375,8 @@ public class %(class_name)s {
         if self._resolve_path_style() != "kebab-case":
             return name
         if self._schema_split_camel():
-            name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1-\2", name)
-            name = re.sub(r"([a-z0-9])([A-Z])", r"\1-\2", name)
+            name = _ACRONYM_BOUNDARY_RE.sub(r"\1-\2", name)
+            name = _LOWER_UPPER_BOUNDARY_RE.sub(r"\1-\2", name)
             return name.replace("_", "-").lower()
         return name.replace("_", "-")
 
@@ -1408,7 +1423,7 @@ public class %(class_name)s {
             if explicit:
                 return explicit.strip()
         if slot.range:
-            range_cls = self._sv.get_class(slot.range)
+            range_cls = self._get_class(slot.range)
             if range_cls is not None:
                 range_path = self._class_annotation(range_cls, "openapi.path")
                 if range_path:
@@ -1432,8 +1447,20 @@ public class %(class_name)s {
             self._induced_slots_cache[class_name] = cached
         return cached
 
+    def _get_class(self, class_name: str) -> ClassDefinition | None:
+        """Cached wrapper around ``SchemaView.get_class``.
+
+        Range checks, ``is_a`` walks and the per-class render all resolve
+        the same names repeatedly; misses (scalar ranges) cache as None.
+        """
+        if class_name in self._class_cache:
+            return self._class_cache[class_name]
+        cls = self._sv.get_class(class_name)
+        self._class_cache[class_name] = cls
+        return cls
+
     def _has_identifier(self, cls: ClassDefinition) -> bool:
-        return any(slot.identifier for slot in self._induced_slots(cls.name))
+        return self._identifier_slot_for(cls.name) is not None
 
     def _local_slot_names(self, cls: ClassDefinition) -> list[str]:
         own = self._induced_slots(cls.name)
@@ -1449,12 +1476,23 @@ public class %(class_name)s {
         return None
 
     def _class_annotation(self, cls: ClassDefinition, tag: str) -> str | None:
-        if not cls or not cls.annotations:
+        """Read one class annotation from the per-class ``{tag: value}`` cache.
+
+        Every render pass (DTO, controller, media types, path segment,
+        request-body resolution) asks for several ``openapi.*`` tags per
+        class; the annotations are only scanned once per class.
+        """
+        if not cls:
             return None
-        for ann in cls.annotations.values():
-            if ann.tag == tag:
-                return str(ann.value)
-        return None
+        anns = self._class_annotations_cache.get(cls.name)
+        if anns is None:
+            anns = (
+                {ann.tag: str(ann.value) for ann in cls.annotations.values()}
+                if cls.annotations
+                else {}
+            )
+            self._class_annotations_cache[cls.name] = anns
+        return anns.get(tag)
 
     def _request_body_class(self, cls: ClassDefinition, op: str) -> str | None:
         """Distinct request-body Java type for POST/PUT (#66).
@@ -1479,7 +1517,7 @@ public class %(class_name)s {
         if not override:
             return None
         target = override.strip()
-        if self._sv.get_class(target) is None:
+        if self._get_class(target) is None:
             raise ValueError(
                 f"Class {cls.name!r} is annotated with a request-body class {target!r} "
                 "that is not defined in the schema. Add the class or drop the annotation."
@@ -1489,14 +1527,14 @@ public class %(class_name)s {
     def _resource_class_names(self) -> set[str]:
         out: set[str] = set()
         for name in self._sv.all_classes():
-            cls = self._sv.get_class(name)
+            cls = self._get_class(name)
             if cls and self._is_resource(cls):
                 out.add(name)
         return out
 
     def _class_path_id_name(self, class_name: str) -> str:
         """Honor openapi.path_id; fall back to <class_snake>_id."""
-        cls = self._sv.get_class(class_name)
+        cls = self._get_class(class_name)
         if cls is not None:
             explicit = self._class_annotation(cls, "openapi.path_id")
             if explicit:
@@ -1507,10 +1545,12 @@ public class %(class_name)s {
         return self._path_segment(cls)
 
     def _identifier_slot_for(self, class_name: str) -> SlotDefinition | None:
-        for s in self._induced_slots(class_name):
-            if s.identifier:
-                return s
-        return None
+        """Identifier slot of the class, or None; cached per class name."""
+        if class_name not in self._identifier_slot_cache:
+            self._identifier_slot_cache[class_name] = next(
+                (s for s in self._induced_slots(class_name) if s.identifier), None
+            )
+        return self._identifier_slot_cache[class_name]
 
     def _induced_slots_by_name(self, class_name: str) -> dict[str, SlotDefinition]:
         return {s.name: s for s in self._induced_slots(class_name)}
@@ -1532,7 +1572,7 @@ public class %(class_name)s {
             field_name = self._discriminator_field(cur)
             if field_name:
                 return field_name.strip()
-            cur = self._sv.get_class(cur.is_a) if cur.is_a else None
+            cur = self._get_class(cur.is_a) if cur.is_a else None
         return None
 
     def _discriminator_root(self, cls: ClassDefinition) -> ClassDefinition | None:
@@ -1541,7 +1581,7 @@ public class %(class_name)s {
         while cur is not None:
             if self._discriminator_field(cur):
                 last = cur
-            cur = self._sv.get_class(cur.is_a) if cur.is_a else None
+            cur = self._get_class(cur.is_a) if cur.is_a else None
         return last
 
     def _inherited_legacy_field(self, cls: ClassDefinition) -> str | None:
@@ -1563,12 +1603,12 @@ public class %(class_name)s {
             return None
         # Only the root carries the annotation. If a parent in the
         # chain also declares the discriminator, defer to it.
-        parent = self._sv.get_class(cls.is_a) if cls.is_a else None
+        parent = self._get_class(cls.is_a) if cls.is_a else None
         if parent is not None and self._inherited_discriminator(parent):
             return None
         subtypes = []
         for name in self._sv.class_descendants(cls.name, reflexive=False):
-            sub = self._sv.get_class(name)
+            sub = self._get_class(name)
             if sub is None or sub.abstract or sub.mixin:
                 continue
             subtypes.append({"class_name": sub.name, "tag": self._type_value(sub)})
@@ -1622,18 +1662,20 @@ def _escape_java(text: str) -> str:
     )
 
 
+@lru_cache(maxsize=None)
 def _java_identifier(s: str) -> str:
     """Sanitise ``s`` to a valid Java field identifier — keep
     alphanumerics, drop everything else (``#``, ``@``, ``-``, etc.).
     Empty / illegal-leading-char results fall back to ``field``."""
-    out = re.sub(r"[^A-Za-z0-9_]", "", s).lstrip("0123456789")
+    out = _NON_JAVA_IDENTIFIER_RE.sub("", s).lstrip("0123456789")
     return out or "field"
 
 
+@lru_cache(maxsize=None)
 def _camel(s: str) -> str:
     """Convert ``slot_name`` / ``slot-name`` to ``SlotName`` for
     constructing Java method names from LinkML slot names."""
-    parts = re.split(r"[_\-\s]+", s)
+    parts = _WORD_SEPARATOR_RE.split(s)
     return "".join(p[:1].upper() + p[1:] for p in parts if p)
 
 
@@ -0,0 +1,13 @@
+"""YAML loading shared by the test modules."""
+
+import yaml
+
+# libyaml's C loader when available; the tests parse many generated specs.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+def load_yaml(text: str):
+    return yaml.load(text, Loader=_YamlLoader)
@@ -25,16 +25,17 @@ codegens) need:
 from pathlib import Path
 
 import pytest
-import yaml
 
 from linkml_openapi.generator import OpenAPIGenerator
 
+from ._yaml import load_yaml
+
 FIXTURE = str(Path(__file__).parent / "fixtures" / "dcat3.yaml")
 
 
 @pytest.fixture(scope="module")
 def spec() -> dict:
-    return yaml.safe_load(OpenAPIGenerator(FIXTURE).serialize())
+    return load_yaml(OpenAPIGenerator(FIXTURE).serialize())
 
 
 @pytest.fixture(scope="module")
@@ -7,11 +7,12 @@ import subprocess
 from pathlib import Path
 
 import pytest
-import yaml
 from openapi_spec_validator import validate
 
 from linkml_openapi.generator import OpenAPIGenerator
 
+from ._yaml import load_yaml
+
 EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 
@@ -54,7 +55,7 @@ def test_generated_spec_is_valid_openapi(schema_path: Path, request) -> None:
             "$ref resolution; this is a known validator limitation."
         )
     gen = OpenAPIGenerator(str(schema_path))
-    spec = yaml.safe_load(gen.serialize(format="yaml"))
+    spec = load_yaml(gen.serialize(format="yaml"))
     validate(spec)
 
 
@@ -65,7 +66,7 @@ def test_generated_spec_is_valid_openapi(schema_path: Path, request) -> None:
 )
 def test_committed_golden_file_is_valid_openapi(example_dir: Path) -> None:
     """Committed openapi.yaml golden files pass OpenAPI 3.1 validation."""
-    spec = yaml.safe_load((example_dir / "openapi.yaml").read_text())
+    spec = load_yaml((example_dir / "openapi.yaml").read_text())
     validate(spec)
 
 
@@ -3,10 +3,11 @@
 from pathlib import Path
 
 import pytest
-import yaml
 
 from linkml_openapi.generator import OpenAPIGenerator
 
+from ._yaml import load_yaml
+
 EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
 
 EXAMPLE_DIRS = sorted(
@@ -24,8 +25,8 @@ def test_example_output_matches(example_dir: Path) -> None:
     expected_path = example_dir / "openapi.yaml"
 
     gen = OpenAPIGenerator(str(schema_path))
-    actual = yaml.safe_load(gen.serialize(format="yaml"))
-    expected = yaml.safe_load(expected_path.read_text())
+    actual = load_yaml(gen.serialize(format="yaml"))
+    expected = load_yaml(expected_path.read_text())
 
     assert actual == expected, (
         f"Generated output for {example_dir.name} does not match committed openapi.yaml. "
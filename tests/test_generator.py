@@ -1,9 +1,11 @@
 """Tests for the OpenAPI generator."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
+import pytest
+from linkml_runtime.utils.schemaview import SchemaView
 
 from linkml_openapi.generator import (
     OpenAPIGenerator,
@@ -11,20 +13,55 @@ from linkml_openapi.generator import (
     _to_snake_case,
 )
 
+from ._yaml import load_yaml
+
+# orjson (dev / `fast` extra) parses the JSON-format specs several times
+# faster than the stdlib and yields the same dicts.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
 FIXTURES = Path(__file__).parent / "fixtures"
 SCHEMA_PATH = str(FIXTURES / "person.yaml")
 
 
+@lru_cache(maxsize=None)
+def _person_schemaview() -> SchemaView:
+    """One SchemaView over the person fixture, shared by every test.
+
+    The generator only reads the view, so reusing it skips re-parsing
+    the fixture and lets SchemaView's own lookup caches stay warm.
+    """
+    return SchemaView(SCHEMA_PATH)
+
+
 def _make_generator(**kwargs) -> OpenAPIGenerator:
-    return OpenAPIGenerator(SCHEMA_PATH, **kwargs)
+    return OpenAPIGenerator(_person_schemaview(), **kwargs)
+
+
+# Serialized specs built by `_generate`, keyed by its kwargs. Most tests
+# ask for the default spec, so this saves re-loading the SchemaView and
+# re-serializing for every assertion. The text is re-parsed per call, so
+# each caller gets its own dict and a mutating test can't leak state.
+_SPEC_CACHE: dict[tuple, str] = {}
 
 
 def _generate(**kwargs) -> dict:
-    gen = _make_generator(**kwargs)
-    raw = gen.serialize(format=kwargs.get("format", "yaml"))
-    if kwargs.get("format") == "json":
-        return json.loads(raw)
-    return yaml.safe_load(raw)
+    # JSON by default: the assertions are on the parsed dict, and JSON
+    # parses far faster than YAML. TestSerialization covers the YAML path.
+    kwargs.setdefault("format", "json")
+    # List kwargs (e.g. resource_filter) are unhashable; build those uncached.
+    key = (
+        None if any(isinstance(v, list) for v in kwargs.values()) else tuple(sorted(kwargs.items()))
+    )
+    raw = _SPEC_CACHE.get(key) if key is not None else None
+    if raw is None:
+        raw = _make_generator(**kwargs).serialize()
+        if key is not None:
+            _SPEC_CACHE[key] = raw
+    return load_yaml(raw) if kwargs["format"] == "yaml" else _json_loads(raw)
 
 
 def _generate_from_string(schema_yaml: str, **kwargs) -> dict:
@@ -41,7 +78,7 @@ def _generate_from_string(schema_yaml: str, **kwargs) -> dict:
         f.write(schema_yaml)
         tmp = f.name
     try:
-        return yaml.safe_load(OpenAPIGenerator(tmp, **kwargs).serialize(format="yaml"))
+        return load_yaml(OpenAPIGenerator(tmp, **kwargs).serialize(format="yaml"))
     finally:
         Path(tmp).unlink(missing_ok=True)
 
@@ -90,9 +127,7 @@ class TestUtils:
         """Class names with irregular English plurals warn so the user sets openapi.path."""
         import warnings
 
-        from linkml_openapi.generator import OpenAPIGenerator
-
-        gen = OpenAPIGenerator(SCHEMA_PATH)
+        gen = _make_generator()
 
         class FakeCls:
             name = "Child"
@@ -288,20 +323,19 @@ class TestPaths:
         # email is not annotated as query_param
         assert "email" not in param_names
 
-    def test_collection_path_address_no_post(self):
-        """Address with openapi.operations: 'list,read' has no POST."""
-        spec = _generate()
-        collection = spec["paths"]["/addresses"]
-        assert "get" in collection
-        assert "post" not in collection
-
-    def test_item_path_address_no_put_delete(self):
-        """Address with openapi.operations: 'list,read' has no PUT/DELETE."""
-        spec = _generate()
-        item = spec["paths"]["/addresses/{id}"]
-        assert "get" in item
-        assert "put" not in item
-        assert "delete" not in item
+    @pytest.mark.parametrize(
+        ("path", "method", "present"),
+        [
+            ("/addresses", "get", True),
+            ("/addresses", "post", False),
+            ("/addresses/{id}", "get", True),
+            ("/addresses/{id}", "put", False),
+            ("/addresses/{id}", "delete", False),
+        ],
+    )
+    def test_address_operations_limited(self, path, method, present):
+        """Address with openapi.operations: 'list,read' has no POST/PUT/DELETE."""
+        assert (method in _generate()["paths"][path]) is present
 
     def test_resource_filter_limits_classes(self):
         spec = _generate(resource_filter=["Address"])
@@ -314,17 +348,35 @@ class TestPaths:
 
 
 class TestSerialization:
+    # The format probes only check the serializer's leading bytes; the
+    # full parse of both formats is test_yaml_and_json_parse_to_same_spec.
     def test_yaml_output(self):
-        gen = _make_generator()
-        output = gen.serialize(format="yaml")
-        parsed = yaml.safe_load(output)
-        assert parsed["openapi"] == "3.0.3"
+        output = _make_generator().serialize()
+        assert output.startswith("openapi: 3.0.3\n")
 
     def test_json_output(self):
-        gen = _make_generator(format="json")
-        output = gen.serialize(format="json")
-        parsed = json.loads(output)
-        assert parsed["openapi"] == "3.0.3"
+        output = _make_generator(format="json").serialize()
+        assert output.startswith('{\n  "openapi": "3.0.3",')
+
+    def test_yaml_and_json_parse_to_same_spec(self):
+        """`_generate` asserts on the JSON form; it must match the YAML one."""
+        yaml_spec = load_yaml(_make_generator(format="yaml").serialize())
+        assert yaml_spec == json.loads(_make_generator(format="json").serialize())
+
+    def test_accepts_loaded_schemaview(self):
+        sv = SchemaView(SCHEMA_PATH)
+        gen = OpenAPIGenerator(sv)
+        assert gen.schemaview is sv
+        assert gen.serialize() == OpenAPIGenerator(SCHEMA_PATH).serialize()
+
+    def test_serialize_to_matches_serialize(self):
+        import io
+
+        for fmt in ("yaml", "json"):
+            gen = _make_generator(format=fmt)
+            buf = io.StringIO()
+            gen.serialize_to(buf)
+            assert buf.getvalue() == gen.serialize()
 
     def test_is_linkml_generator(self):
         """Verify it extends our minimal Generator shim and exposes a SchemaView.
@@ -336,8 +388,6 @@ class TestSerialization:
         OpenAPI generator depends on — `valid_formats`, `uses_schemaloader`,
         `schemaview` — is preserved.
         """
-        from linkml_runtime.utils.schemaview import SchemaView
-
         from linkml_openapi._base import Generator
 
         gen = _make_generator()
@@ -345,6 +395,41 @@ class TestSerialization:
         assert gen.uses_schemaloader is False
         assert isinstance(gen.schemaview, SchemaView)
 
+    def test_cli_stdout_matches_serialize(self):
+        """`gen-openapi` streams via serialize_to; stdout stays `serialize()` + newline."""
+        from click.testing import CliRunner
+
+        from linkml_openapi.cli import cli
+
+        for fmt in ("yaml", "json"):
+            result = CliRunner().invoke(cli, [SCHEMA_PATH, "--format", fmt])
+            assert result.exit_code == 0, result.output
+            assert result.output == _make_generator(format=fmt).serialize() + "\n"
+
+    def test_cli_imports_stay_light(self):
+        """Both CLI modules defer the generator imports to the command body,
+        so `--help` / `--version` never load pydantic or linkml-runtime."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "import linkml_openapi.cli, linkml_openapi.spring.cli\n"
+            "heavy = {'pydantic', 'openapi_pydantic', 'linkml_runtime'} & set(sys.modules)\n"
+            "assert not heavy, sorted(heavy)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+    def test_cli_choices_match_generator(self):
+        """The CLI hardcodes its choice lists so it can import the generator lazily."""
+        from linkml_openapi.cli import cli
+        from linkml_openapi.generator import SUPPORTED_PATH_STYLES
+
+        choices = {p.name: p.type.choices for p in cli.params if hasattr(p.type, "choices")}
+        assert list(choices["format"]) == OpenAPIGenerator.valid_formats
+        assert list(choices["path_style"]) == sorted(SUPPORTED_PATH_STYLES)
+
 
 # --- Slot annotation tests ---
 
@@ -478,19 +563,6 @@ class TestSlotAnnotations:
         params = item.get("parameters", [])
         assert any(p["name"] == "id" and p["in"] == "path" for p in params)
 
-    def test_query_param_from_annotation(self):
-        """Person has name and age annotated as query params."""
-        spec = _generate()
-        list_op = spec["paths"]["/persons"]["get"]
-        param_names = {p["name"] for p in list_op["parameters"]}
-        assert "name" in param_names
-        assert "age" in param_names
-        # email is NOT annotated as query_param, so should not appear
-        assert "email" not in param_names
-        # limit/offset always present
-        assert "limit" in param_names
-        assert "offset" in param_names
-
     def test_no_slot_annotations_falls_back(self):
         """Organization has no slot annotations, gets auto-inferred params."""
         spec = _generate(resource_filter=["Organization"])
@@ -500,19 +572,6 @@ class TestSlotAnnotations:
         assert "offset" in param_names
         # Organization inherits from NamedThing which has name, description
 
-    def test_operations_limits_methods(self):
-        """Address with openapi.operations: 'list,read' has no POST/PUT/DELETE."""
-        spec = _generate()
-        # Collection path should only have GET (list), no POST (create)
-        collection = spec["paths"]["/addresses"]
-        assert "get" in collection
-        assert "post" not in collection
-        # Item path should only have GET (read), no PUT/DELETE
-        item = spec["paths"]["/addresses/{id}"]
-        assert "get" in item
-        assert "put" not in item
-        assert "delete" not in item
-
 
 class TestPathVariableMode:
     def test_iri_mode_preserves_uri_format(self):
@@ -808,7 +867,7 @@ classes:
             tmp = f.name
         try:
             gen = OpenAPIGenerator(tmp)
-            spec = yaml.safe_load(gen.serialize(format="yaml"))
+            spec = load_yaml(gen.serialize(format="yaml"))
             assert "ResourceLink" not in spec["components"]["schemas"]
         finally:
             Path(tmp).unlink(missing_ok=True)
@@ -1046,7 +1105,7 @@ classes:
             tmp = f.name
         try:
             gen = OpenAPIGenerator(tmp)
-            spec = yaml.safe_load(gen.serialize(format="yaml"))
+            spec = load_yaml(gen.serialize(format="yaml"))
             # User's Problem wins — has `reason`, not the RFC 7807 fields.
             assert "reason" in spec["components"]["schemas"]["Problem"]["properties"]
             assert "instance" not in spec["components"]["schemas"]["Problem"]["properties"]
@@ -1080,7 +1139,7 @@ classes:
             tmp = f.name
         try:
             gen = OpenAPIGenerator(tmp)
-            spec = yaml.safe_load(gen.serialize(format="yaml"))
+            spec = load_yaml(gen.serialize(format="yaml"))
             # No synthesised Problem.
             assert "Problem" not in spec["components"]["schemas"]
             # 404 references ApiError instead.
@@ -1115,7 +1174,7 @@ classes:
             tmp = f.name
         try:
             gen = OpenAPIGenerator(tmp)
-            spec = yaml.safe_load(gen.serialize(format="yaml"))
+            spec = load_yaml(gen.serialize(format="yaml"))
             assert "Problem" not in spec["components"]["schemas"]
             problem = spec["components"]["schemas"]["ProblemDetail"]
             # RFC 7807 fields still present under the renamed schema.
@@ -1161,7 +1220,7 @@ classes:
             with warnings.catch_warnings(record=True) as caught:
                 warnings.simplefilter("always")
                 gen = OpenAPIGenerator(tmp)
-                spec = yaml.safe_load(gen.serialize(format="yaml"))
+                spec = load_yaml(gen.serialize(format="yaml"))
             assert any("openapi.error_class_name" in str(w.message) for w in caught), (
                 f"expected UserWarning naming the conflict, got {[str(w.message) for w in caught]}"
             )
@@ -1641,9 +1700,7 @@ classes:
         """Unknown style values raise with the supported list."""
         import pytest
 
-        from linkml_openapi.generator import OpenAPIGenerator
-
-        gen = OpenAPIGenerator(SCHEMA_PATH, path_style="camelCase")
+        gen = _make_generator(path_style="camelCase")
         with pytest.raises(ValueError, match="Unsupported"):
             gen.serialize(format="yaml")
 
@@ -1666,8 +1723,6 @@ classes:
     def test_path_split_camel_off_by_default_under_kebab(self, tmp_path):
         """Without `openapi.path_split_camel`, kebab-case only swaps
         underscores. CamelCase slot names pass through unchanged."""
-        import yaml
-
         from linkml_openapi.generator import OpenAPIGenerator
 
         fixture = tmp_path / "schema.yaml"
@@ -1688,14 +1743,12 @@ classes:
     attributes:
       id: { identifier: true, range: string, required: true }
 """)
-        spec = yaml.safe_load(OpenAPIGenerator(str(fixture)).serialize())
+        spec = load_yaml(OpenAPIGenerator(str(fixture)).serialize())
         assert "/hubs/{id}/contactPoint" in spec["paths"]
 
     def test_path_split_camel_splits_camelcase_under_kebab(self, tmp_path):
         """`openapi.path_split_camel: "true"` + `kebab-case` splits
         camelCase boundaries: `contactPoint` → `contact-point`."""
-        import yaml
-
         from linkml_openapi.generator import OpenAPIGenerator
 
         fixture = tmp_path / "schema.yaml"
@@ -1718,7 +1771,7 @@ classes:
     attributes:
       id: { identifier: true, range: string, required: true }
 """)
-        spec = yaml.safe_load(OpenAPIGenerator(str(fixture)).serialize())
+        spec = load_yaml(OpenAPIGenerator(str(fixture)).serialize())
         assert "/hubs/{id}/contact-point" in spec["paths"]
         assert "/hubs/{id}/serves-dataset" in spec["paths"]
         # camelCase form is no longer present
@@ -1726,8 +1779,6 @@ classes:
 
     def test_path_split_camel_acronym_aware(self, tmp_path):
         """Acronym-aware: `XMLParser` → `xml-parser`, not `x-m-l-parser`."""
-        import yaml
-
         from linkml_openapi.generator import OpenAPIGenerator
 
         fixture = tmp_path / "schema.yaml"
@@ -1749,7 +1800,7 @@ classes:
     attributes:
       id: { identifier: true, range: string, required: true }
 """)
-        spec = yaml.safe_load(OpenAPIGenerator(str(fixture)).serialize())
+        spec = load_yaml(OpenAPIGenerator(str(fixture)).serialize())
         assert "/hubs/{id}/xml-parser" in spec["paths"]
 
     def test_operation_ids_and_property_keys_unchanged(self):
@@ -2356,7 +2407,7 @@ class TestRangeClassPathSegmentAndTargetTag:
     @staticmethod
     def _spec() -> dict:
         gen = OpenAPIGenerator(str(FIXTURES / "dcat3-acme.yaml"))
-        return yaml.safe_load(gen.serialize())
+        return load_yaml(gen.serialize())
 
     # --- #85: URL segment from range class's openapi.path ---
 
@@ -2450,7 +2501,7 @@ class TestCanonicalOnlyNestedSuppression:
     @staticmethod
     def _spec() -> dict:
         gen = OpenAPIGenerator(str(FIXTURES / "dcat3-acme.yaml"))
-        return yaml.safe_load(gen.serialize())
+        return load_yaml(gen.serialize())
 
     def test_canonical_chain_item_path_emits(self):
         """Distribution has parent_path: Catalog.dataset/Dataset.distribution
@@ -2489,7 +2540,7 @@ class TestRdfResolvedMap:
     @staticmethod
     def _spec(rdf_resolved_map: bool = False) -> dict:
         gen = OpenAPIGenerator(str(FIXTURES / "dcat3-acme.yaml"), rdf_resolved_map=rdf_resolved_map)
-        return yaml.safe_load(gen.serialize())
+        return load_yaml(gen.serialize())
 
     def test_default_off_no_resolved_map(self):
         """Without the flag, schemas regenerate byte-identically — no
@@ -2552,7 +2603,7 @@ class TestSlotUsageNarrowingMaterialises:
     @staticmethod
     def _spec() -> dict:
         gen = OpenAPIGenerator(str(FIXTURES / "dcat3-acme.yaml"))
-        return yaml.safe_load(gen.serialize())
+        return load_yaml(gen.serialize())
 
     def test_parent_keeps_wide_oneof(self):
         """The base class still carries the polymorphic ``oneOf`` at
@@ -2700,7 +2751,7 @@ class TestEmitNamespaces:
     @staticmethod
     def _spec(emit_namespaces: bool = False) -> dict:
         gen = OpenAPIGenerator(str(FIXTURES / "dcat3-acme.yaml"), emit_namespaces=emit_namespaces)
-        return yaml.safe_load(gen.serialize())
+        return load_yaml(gen.serialize())
 
     def test_default_off(self):
         spec = self._spec(emit_namespaces=False)
@@ -2722,7 +2773,7 @@ class TestRangesResolved:
     @staticmethod
     def _spec(rdf_resolved_map: bool = False) -> dict:
         gen = OpenAPIGenerator(str(FIXTURES / "dcat3-acme.yaml"), rdf_resolved_map=rdf_resolved_map)
-        return yaml.safe_load(gen.serialize())
+        return load_yaml(gen.serialize())
 
     def test_default_off(self):
         """No `x-ranges-resolved` blocks appear without the flag."""
@@ -3044,9 +3095,7 @@ class TestRdfExtensions:
 
     def test_class_with_unknown_prefix_falls_back_to_curie(self):
         """A class_uri whose prefix is not in `prefixes` is emitted as-is."""
-        from linkml_openapi.generator import OpenAPIGenerator
-
-        gen = OpenAPIGenerator(SCHEMA_PATH)
+        gen = _make_generator()
         # SchemaView.expand_curie passes unknown CURIEs through.
         assert gen.schemaview.expand_curie("unknown:Foo") == "unknown:Foo"
 
@@ -3460,3 +3509,50 @@ classes:
         refs = {r["$ref"] for r in prop["oneOf"]}
         assert refs == {"#/components/schemas/Dog", "#/components/schemas/Cat"}
         assert "discriminator" not in prop
+
+
+class TestBuildCaches:
+    """Per-build memoisation of SchemaView lookups. Output is covered by
+    the rest of the suite; these guard the call counts."""
+
+    def test_each_class_is_induced_once_per_build(self):
+        from collections import Counter
+
+        # Own SchemaView: the shared one must not keep the counting hook.
+        gen = OpenAPIGenerator(SCHEMA_PATH)
+        sv = gen.schemaview
+        calls: Counter[str] = Counter()
+        original = sv.class_induced_slots
+
+        def counting(name, *args, **kwargs):
+            calls[name] += 1
+            return original(name, *args, **kwargs)
+
+        sv.class_induced_slots = counting
+        gen.serialize()
+        assert calls
+        assert max(calls.values()) == 1
+
+    def test_generate_returns_independent_specs(self):
+        """`_generate` caches the serialized spec, not the parsed dict, so
+        a test that mutates its spec can't leak into any other test."""
+        spec = _generate()
+        spec["paths"].clear()
+        assert _generate()["paths"]
+        assert _generate(format="json") == _generate()
+
+    def test_slot_schema_memoised_per_induced_slot(self):
+        """Same induced slot → same schema object; a same-named slot
+        induced on another class is rendered separately (slot_usage can
+        narrow it)."""
+        gen = _make_generator()
+        gen.serialize()
+        person_name = gen._induced_slots_by_name("Person")["name"]
+        assert gen._slot_to_schema(person_name) is gen._slot_to_schema(person_name)
+        other = next(
+            slots["name"]
+            for cls, slots in gen._induced_slot_cache.items()
+            if cls != "Person" and "name" in slots
+        )
+        assert other is not person_name
+        assert gen._slot_to_schema(other) is not gen._slot_to_schema(person_name)
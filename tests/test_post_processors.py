@@ -12,7 +12,6 @@ from __future__ import annotations
 import copy
 
 import pytest
-import yaml
 
 from linkml_openapi.generator import OpenAPIGenerator
 from linkml_openapi.post_processors import REGISTRY, apply
@@ -20,6 +19,8 @@ from linkml_openapi.post_processors.extract_inline_oneof import (
     extract_inline_oneof,
 )
 
+from ._yaml import load_yaml
+
 
 class TestRegistry:
     def test_known_post_processors_registered(self):
@@ -260,7 +261,7 @@ classes:
             path = f.name
         try:
             gen = OpenAPIGenerator(path, **kwargs)
-            return yaml.safe_load(gen.serialize())
+            return load_yaml(gen.serialize())
         finally:
             Path(path).unlink(missing_ok=True)
 
@@ -268,8 +269,8 @@ classes:
         from pathlib import Path
 
         fixture = str(Path(__file__).parent / "fixtures" / "dcat3.yaml")
-        canonical = yaml.safe_load(OpenAPIGenerator(fixture).serialize())
-        processed = yaml.safe_load(
+        canonical = load_yaml(OpenAPIGenerator(fixture).serialize())
+        processed = load_yaml(
             OpenAPIGenerator(
                 fixture,
                 post_processors=["extract-inline-oneof"],
@@ -240,3 +240,33 @@ def test_annotated_class_disables_auto_inference_for_unannotated_slots(tmp_path)
     surface = _walk(sv, "Person")
     names = [spec.slot.name for spec in surface.params]
     assert names == ["name"]  # age, email NOT auto-inferred
+
+
+def test_is_enum_hook_classifies_auto_inferred_ranges(tmp_path):
+    """A caller-supplied `is_enum` replaces the `sv.get_enum` lookup."""
+    yaml = (
+        SCHEMA_BASE
+        + """\
+      status: { range: Status }
+enums:
+  Status:
+    permissible_values:
+      active: {}
+"""
+    )
+    sv = _sv_from_text(yaml, tmp_path)
+    default = _walk(sv, "Person")
+    assert "status" in [spec.slot.name for spec in default.params]
+
+    cls = sv.get_class("Person")
+    surface = walk_query_params(
+        sv,
+        cls,
+        schema_auto_default=True,
+        is_slot_excluded=lambda s: False,
+        induced_slots=lambda name: list(sv.class_induced_slots(name)),
+        get_slot_annotation=_get_slot_ann,
+        get_class_annotation=_get_class_ann,
+        is_enum=frozenset().__contains__,
+    )
+    assert "status" not in [spec.slot.name for spec in surface.params]